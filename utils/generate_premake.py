@@ -5,22 +5,37 @@ Migrates from shell-based compile.sh to Premake5-based build system
 while preserving the existing JSON configuration structure.
 """
 
+import argparse
+import hashlib
+import io
 import json
 import os
+import pickle
 import sys
-import glob
 import platform
 import copy
+import re
 import shutil
 import subprocess
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+# orjson parses the config several times faster when it is installed; the
+# stdlib parser is the fallback. Both take raw bytes and raise a
+# json.JSONDecodeError subclass on malformed input.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Verbosity: progress/DEBUG output is silenced by default so build invocations
-# stay quiet; pass --verbose (-V) to restore it. Real errors and warnings always
-# go to stderr via elog() regardless, so silencing stdout never hides failures.
-_VERBOSE = False
+# stay quiet; pass --verbose (-V) or set PREMAKE_GEN_DEBUG to restore it. Real
+# errors and warnings always go to stderr via elog() regardless, so silencing
+# stdout never hides failures. vlog() arguments are still formatted before the
+# check, so messages that are costly to build are guarded with `if _VERBOSE:`.
+_VERBOSE = bool(os.environ.get('PREMAKE_GEN_DEBUG'))
 
 def vlog(*args, **kwargs):
     """Progress/DEBUG output — shown only when --verbose is set."""
@@ -32,10 +47,367 @@ def elog(*args, **kwargs):
     kwargs.setdefault('file', sys.stderr)
     print(*args, **kwargs)
 
+# --platform spellings, normalized to one key per target platform
+_PLATFORM_ALIASES = {
+    'mac': 'mac', 'macos': 'mac', 'darwin': 'mac',
+    'linux': 'linux', 'lin': 'linux',
+    'windows': 'windows', 'win': 'windows',
+}
+
+# Config "platform" values, normalized to the same platform keys
+_CONFIG_PLATFORM_KEYS = {
+    'Linux': 'linux', 'Linux_x64': 'linux',
+    'macOS': 'mac', 'Darwin': 'mac',
+    'Windows': 'windows',
+}
+
+# Default premake file for each target platform
+_PREMAKE_FILES = {'mac': 'premake5.mac.lua', 'linux': 'premake5.lin.lua', 'windows': 'premake5.win.lua'}
+
+# Role of a positional path on the command line, by file extension
+_PATH_ROLES = {'.json': 'config', '.lua': 'output'}
+
+def _host_platform_key(system_name):
+    """Map a platform.system() name to a platform key, or None if unknown."""
+    if system_name == 'Darwin':
+        return 'mac'
+    if system_name == 'Linux':
+        return 'linux'
+    if (system_name == 'Windows' or system_name.startswith(('MINGW', 'MSYS', 'CYGWIN'))
+            or 'MSYS_NT' in system_name):
+        return 'windows'
+    return None
+
+def _config_cache_path(config_path):
+    """Pickle sidecar for a config file, one per config path."""
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    key = hashlib.blake2b(os.path.abspath(config_path).encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(cache_root, 'premake_gen', f'{key}.pkl')
+
+def _read_config_cache(cache_path):
+    """Return the (signature, pickled config) stored in a sidecar, or None.
+
+    Only a regular file owned by the current user is trusted, so a sidecar
+    planted in a shared cache directory is never unpickled.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+                return None
+            signature, blob = pickle.loads(f.read())
+    except Exception:
+        return None
+    return signature, blob
+
+# Pickled configs already loaded by this process, by sidecar cache path, as
+# (signature, bytes). Bytes rather than objects: generators mutate their
+# config, so each load unpickles a private copy.
+_CONFIG_MEMO = {}
+
+def _load_config(config_path):
+    """Load the JSON config, reusing a pickled copy from this or an earlier run.
+
+    Each config path has a single sidecar that records the (mtime_ns, size)
+    it was built from; a sidecar for another version of the file is stale
+    and gets overwritten. Each call returns a fresh object, so callers may
+    mutate it freely. The on-disk cache is best-effort: any failure to read
+    or write it falls back to parsing the JSON.
+    """
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        cache_path = signature = None
+    else:
+        cache_path = _config_cache_path(config_path)
+        signature = (st.st_mtime_ns, st.st_size)
+    if cache_path:
+        cached = _CONFIG_MEMO.get(cache_path) or _read_config_cache(cache_path)
+        if cached and cached[0] == signature:
+            try:
+                config = pickle.loads(cached[1])
+            except Exception:
+                pass
+            else:
+                _CONFIG_MEMO[cache_path] = cached
+                return config
+    with open(config_path, 'rb') as f:
+        config = _json_loads(f.read())
+    if cache_path:
+        cached = (signature, pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL))
+        _CONFIG_MEMO[cache_path] = cached
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+            # Owner-only regardless of the umask, as _read_config_cache requires
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(pickle.dumps(cached, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return config
+
+def _source_languages(source_files, source_patterns=()):
+    """Return (has_c, has_cpp) for explicit source files and glob patterns."""
+    has_c = has_cpp = False
+    for path in source_files:
+        if path.endswith('.c'):
+            has_c = True
+        elif path.endswith('.cpp'):
+            has_cpp = True
+        if has_c and has_cpp:
+            return True, True
+    return (has_c or any('*.c' in pattern for pattern in source_patterns),
+            has_cpp or any('*.cpp' in pattern for pattern in source_patterns))
+
+def _split_flags(flags):
+    """Normalize a flags setting, a space-separated string or a list, to a list."""
+    return flags.split() if isinstance(flags, str) else list(flags)
+
+def _framework_names(flags):
+    """Names following each "-framework" in a split flag list."""
+    names = []
+    parts = iter(flags)
+    for flag in parts:
+        if flag == '-framework':
+            name = next(parts, None)
+            if name is not None:
+                names.append(name)
+    return names
+
+def _classify_external_library(info):
+    """Return (kind, value) for how a parsed external library is linked.
+
+    kind is 'none', 'framework' (value: framework name), 'dynamic' (value:
+    link name without -l, or the library path) or 'static' (value: the
+    configured archive path or -l flag).
+    """
+    link = info.get('link')
+    lib_path = info['lib']
+    if link == 'none':
+        return 'none', None
+    if link == 'dynamic':
+        if lib_path.startswith('-framework '):
+            return 'framework', lib_path[len('-framework '):]
+        return 'dynamic', lib_path[2:] if lib_path.startswith('-l') else lib_path
+    return 'static', lib_path
+
+def _same_file_content(path_a, path_b):
+    """True when both files exist with identical bytes (sizes compared first)."""
+    try:
+        if os.path.getsize(path_a) != os.path.getsize(path_b):
+            return False
+        with open(path_a, 'rb') as a, open(path_b, 'rb') as b:
+            return a.read() == b.read()
+    except OSError:
+        return False
+
+def _stamp_record(generation_key, output_path):
+    """Stamp contents: the generation key plus the output's mtime and size.
+
+    A hand-edited, truncated or replaced output then no longer matches its
+    stamp. Raises OSError when the output does not exist.
+    """
+    st = os.stat(output_path)
+    return f'{generation_key} {st.st_mtime_ns} {st.st_size}'
+
+def _dedup_preserve_order(items):
+    """Drop empty and repeated entries, keeping first-seen order."""
+    return list(dict.fromkeys(item for item in items if item))
+
+# Fixed line groups shared by many generated sections
+_CLOSE_BLOCK = ('    }', '')
+_RESET_FILTER_BLOCK = ('    filter {}', '')
+_CLOSE_NESTED_BLOCK = ('        }', '')
+_CLOSE_NESTED_FILTER_BLOCK = _CLOSE_NESTED_BLOCK + _RESET_FILTER_BLOCK
+
+# MinGW linkoptions that export every symbol of a DLL (and let importers
+# resolve data symbols) when no .def file describes the exports
+_DLL_EXPORT_ALL_LINES = ('        "-Wl,--export-all-symbols",', '        "-Wl,--enable-auto-import",')
+_DLL_EXPORT_ALL_BLOCK = ('    linkoptions {',) + _DLL_EXPORT_ALL_LINES + _CLOSE_BLOCK
+
+# Workspace opening through the debug configurations, which only vary in
+# names and toolset; Windows appends its debug linkoptions right after.
+_WORKSPACE_HEADER_TEMPLATE = '\n'.join((
+    'workspace "{name}"',
+    '    configurations {{ "debug", "debug_profile", "release", "release_profile" }}',
+    '    platforms {{ {platforms} }}',
+    '    location "{location}"',
+    '    startproject "{startproject}"',
+    '    toolset "{toolset}"',
+    '',
+    '    -- Global settings',
+    '    cppdialect "C++17"',
+    '    cdialect "C11"',
+    '    warnings "Extra"',
+    '',
+    '    filter "configurations:debug"',
+    '        defines {{ "DEBUG" }}',
+    '        symbols "On"',
+    '        -- -Og keeps debugging practical while avoiding the O0 runtime penalty.',
+    '        buildoptions {{ "-Og", "-fno-omit-frame-pointer" }}',
+    '',
+    '    filter "configurations:debug_profile"',
+    '        -- Preserve debugger symbols while profiling optimized JS execution.',
+    '        defines {{ "DEBUG", "LAMBDA_JS_EXEC_PROFILE" }}',
+    '        symbols "On"',
+    '        optimize "Speed"',
+    '        buildoptions {{ "-fno-omit-frame-pointer" }}',
+))
+
+# Opening lines shared by every generated project
+_PROJECT_HEADER_TEMPLATE = '\n'.join((
+    'project "{name}"',
+    '    kind "{kind}"',
+    '    language "{language}"',
+    '    targetdir "{target_dir}"',
+    '    objdir "build/obj/%{{prj.name}}"',
+))
+
+# Wrapper projects differ only in name, kind and linked sub-projects. {links}
+# carries its own leading newlines so an empty list leaves no blank line.
+_WRAPPER_PROJECT_TEMPLATE = '\n'.join((
+    'project "{name}"',
+    '    kind "{kind}"',
+    '    language "C++"',
+    '    targetdir "build/lib"',
+    '    objdir "build/obj/%{{prj.name}}"',
+    '',
+    '    -- Wrapper library with empty source file',
+    '    files {{',
+    '        "utils/empty.cpp",',
+    '    }}',
+    '',
+    '    links {{{links}',
+    '    }}',
+    '',
+    '',
+))
+
+def _scan_sources(source_dir, suffixes):
+    """List files directly in source_dir, grouped in the order of suffixes.
+
+    One directory read replaces a glob per suffix; like glob, hidden entries
+    are skipped and a missing directory yields nothing.
+    """
+    groups = {suffix: [] for suffix in suffixes}
+    try:
+        entries = os.scandir(source_dir)
+    except OSError:
+        return []
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name[:1] == '.':
+                continue
+            suffix = os.path.splitext(name)[1]
+            if suffix in groups:
+                groups[suffix].append(f'{source_dir}/{name}')
+    return [path for suffix in suffixes for path in groups[suffix]]
+
+def _quoted_lines(items, indent=8):
+    """Format items as quoted, comma-terminated Lua list entries.
+
+    The entries come back as one multi-line string (in a list, so callers can
+    extend with it) built by a single join rather than one format per item.
+    """
+    if not isinstance(items, (list, tuple)):
+        items = list(items)
+    if not items:
+        return []
+    pad = ' ' * indent
+    body = f'",\n{pad}"'.join(items)
+    return [f'{pad}"{body}",']
+
+def _list_block(keyword, items):
+    """Format a project-level list block: keyword, quoted items, closing brace."""
+    return [f'    {keyword} {{', *_quoted_lines(items), *_CLOSE_BLOCK]
+
+# libdirs of language projects with dependencies: final executables only use
+# build/lib (configured external directories follow), libraries also search
+# the platform package directories
+_EXECUTABLE_LIBDIRS_BLOCK = tuple(_list_block('libdirs', ('build/lib',)))
+_WINDOWS_PROJECT_LIBDIRS_BLOCK = tuple(_list_block('libdirs', ('/clang64/lib', 'win-native-deps/lib', 'build/lib')))
+_PROJECT_LIBDIRS_BLOCK = tuple(_list_block('libdirs', ('/opt/homebrew/lib', '/usr/local/lib', 'build/lib')))
+
 class PremakeGenerator:
+    # Every instance attribute is declared up front; the generator's state is
+    # fixed once __init__ finishes, so no per-instance __dict__ is needed.
+    __slots__ = (
+        'config', 'variant', 'premake_content', '_emitted_sections',
+        'use_linux_config', 'use_macos_config', 'use_windows_config',
+        'external_libraries', '_external_link_kinds', '_build_lib_paths', '_targets_by_name', '_libraries_by_name',
+        '_mixed_language_targets', '_tree_sitter_include_paths',
+        '_external_include_paths', '_test_includedir_lines', '_test_libdir_lines',
+        '_compiler_info_cache', '_build_options_cache', '_consolidated_includes_cache',
+        '_test_runtime_dep_index', '_test_runtime_link_cache', '_test_dir_files',
+    )
+
+    # Top-level config sections validate_config insists on
+    _REQUIRED_SECTIONS = frozenset({'libraries'})
+
+    # Small lib/ utilities whose sources are compiled straight into a meta-library
+    _INLINE_LIBS = frozenset({'strbuf', 'strview', 'mem-pool', 'datetime', 'string', 'num_stack', 'url'})
+
+    # Libraries only linked into test executables, never the main program
+    _TEST_ONLY_LIBS = frozenset({'criterion'})
+
+    # Dependencies (exact names, or split projects by prefix) that pull in the
+    # runtime/data libraries and therefore their external static providers
+    _RUNTIME_DATA_DEPS = frozenset({'lambda-runtime-full', 'lambda-data'})
+    _RUNTIME_DATA_DEP_PREFIXES = ('lambda-runtime-full-', 'lambda-data-')
+
+    # Static archives force-loaded on macOS so curl can find their symbols
+    _MACOS_FORCE_LOAD_LIBS = frozenset({'nghttp2'})
+
+    # Static providers linked after the runtime/data archives, in link order.
+    # Lambda's custom curl was built with an external nghttp2 dependency.
+    _BASE_STATIC_LIBS = ('mpdec', 'utf8proc', 'mir', 'nghttp2', 'curl', 'ssl', 'crypto')
+
+    # Tree-sitter parser archives, in link order; the LaTeX grammars are only
+    # forced in where lambda-data's archive references them (Linux)
+    _TREE_SITTER_LIBS = ('tree-sitter-lambda', 'tree-sitter')
+    _TREE_SITTER_LATEX_LIBS = ('tree-sitter-latex', 'tree-sitter-latex-math')
+
+    # Config flags (without the leading dash) that _get_build_options already adds
+    _BUILTIN_COMPILER_FLAGS = frozenset({'pedantic', 'fdiagnostics-color=auto', 'fms-extensions'})
+
+    # Catch2 archive names (release and debug) a test may list in its libraries
+    _CATCH2_LIBS = frozenset({'Catch2Main', 'Catch2', 'Catch2Maind', 'Catch2d'})
+
+    # Tree-sitter archives a test passes through linkoptions, not links
+    _TEST_LINKOPTION_LIBS = frozenset({'tree-sitter', 'tree-sitter-lambda', 'tree-sitter-latex-math'})
+
+    # Windows system libraries the static curl/ssl stack depends on; test
+    # executables also need the extra LDAP/IP helper providers
+    _WINDOWS_NETWORK_LIBS = ('-lws2_32', '-lwsock32', '-lwinmm', '-lcrypt32', '-lbcrypt', '-ladvapi32')
+    _WINDOWS_TEST_NETWORK_LIBS = _WINDOWS_NETWORK_LIBS + ('-lsecur32', '-lwldap32', '-liphlpapi')
+    _WINDOWS_NETWORK_LIB_LINES = tuple(_quoted_lines(_WINDOWS_NETWORK_LIBS))
+    _WINDOWS_TEST_NETWORK_LIB_LINES = tuple(_quoted_lines(_WINDOWS_TEST_NETWORK_LIBS))
+
+    # Concrete projects a test links for each Lambda runtime dependency, in
+    # archive order. Tests only need the -cpp projects: the C++ project of a
+    # mixed target already includes all of its C files.
+    _RUNTIME_DEP_PROJECTS = {
+        # The validation DSO defers active runtime symbols to its host; link
+        # the concrete runtime provider.
+        'lambda-runtime-full': ('lambda-runtime-full-cpp', 'lambda-rt-cpp'),
+        # lambda-data consumes the lower general-purpose archive; link its
+        # concrete mixed-language project for test executables.
+        'lambda-data': ('lambda-data-cpp', 'lambda-lib-cpp'),
+        # A static wrapper archive contains no objects. Runtime white-box tests
+        # must therefore link the concrete rt archive and its lower concrete
+        # providers in archive order; otherwise GC/side-stack symbols resolve
+        # but their lib providers remain invisible to the linker.
+        'lambda-rt': ('lambda-rt-cpp', 'lambda-data-cpp', 'lambda-lib-cpp'),
+    }
+
     def __init__(self, config_path: str = "build_lambda_config.json", explicit_platform: str = None, variant: str = None):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        self.config = _load_config(config_path)
         configurable_defines = self.config.get('configurable_defines', {})
         if configurable_defines:
             resolved_defines = self.config.setdefault('defines', [])
@@ -44,44 +416,35 @@ class PremakeGenerator:
                     raise ValueError(f"Invalid configurable define name: {name!r}")
                 value = os.environ.get(name, str(default_value))
                 resolved_defines.append(f"{name}={value}")
-        self.premake_content = []
+        self.premake_content = io.StringIO()
+        self._emitted_sections = 0
         self.variant = variant
+        # Derived from the fully loaded config; filled lazily during generation.
+        self._compiler_info_cache = None
+        self._build_options_cache = None
+        self._consolidated_includes_cache = None
+        self._test_runtime_dep_index = None
+        self._test_runtime_link_cache = None
 
         # Add platform detection for use throughout the generator
-        import platform
         current_platform = platform.system()
 
         # If explicit platform is provided, use it to override platform detection
         if explicit_platform:
-            if explicit_platform in ['mac', 'macos', 'darwin']:
-                self.use_linux_config = False
-                self.use_macos_config = True
-                self.use_windows_config = False
-            elif explicit_platform in ['linux', 'lin']:
-                self.use_linux_config = True
-                self.use_macos_config = False
-                self.use_windows_config = False
-            elif explicit_platform in ['windows', 'win']:
-                self.use_linux_config = False
-                self.use_macos_config = False
-                self.use_windows_config = True
-            else:
+            platform_key = _PLATFORM_ALIASES.get(explicit_platform)
+            if platform_key is None:
                 raise ValueError(f"Unknown platform '{explicit_platform}'. Use 'mac', 'linux', or 'windows'")
+            self.use_linux_config = platform_key == 'linux'
+            self.use_macos_config = platform_key == 'mac'
+            self.use_windows_config = platform_key == 'windows'
         else:
-            # Use auto-detection
-            self.use_linux_config = (current_platform == 'Linux' or
-                                     self.config.get('platform') == 'Linux_x64' or
-                                     self.config.get('platform') == 'Linux')
-            self.use_macos_config = (current_platform == 'Darwin' or
-                                    self.config.get('platform') == 'macOS' or
-                                    self.config.get('platform') == 'Darwin')
-            self.use_windows_config = (current_platform == 'Windows' or
-                                      current_platform.startswith('MINGW') or
-                                      current_platform.startswith('MSYS') or
-                                      current_platform.startswith('CYGWIN') or
-                                      'MSYS_NT' in current_platform or
-                                      'MINGW' in current_platform or
-                                      self.config.get('platform') == 'Windows')
+            # Use auto-detection: the host, plus any platform the config pins
+            # (a Linux_x64 config cross-compiles from another host)
+            config_platform_key = _CONFIG_PLATFORM_KEYS.get(self.config.get('platform'))
+            self.use_linux_config = current_platform == 'Linux' or config_platform_key == 'linux'
+            self.use_macos_config = current_platform == 'Darwin' or config_platform_key == 'mac'
+            self.use_windows_config = (_host_platform_key(current_platform) == 'windows' or
+                                      config_platform_key == 'windows')
 
         if self.use_macos_config:
             self._prepare_macos_archive_without_members()
@@ -92,8 +455,50 @@ class PremakeGenerator:
 
         self._expand_node_module_targets()
         self._expand_validation_source_targets()
+        # Targets are complete once expanded; index them for dependency lookups
+        self._targets_by_name = {
+            target.get('name'): target for target in self.config.get('targets', [])
+            if target.get('name')
+        }
 
         self.external_libraries = self._parse_external_libraries()
+        # Include paths of every linkable external library, in definition order
+        self._external_include_paths = tuple(
+            info['include'] for info in self.external_libraries.values()
+            if info.get('link') != 'none' and info['include'])
+        # Premake gmake files live in build/premake/, so relative archive
+        # paths climb back to the repository root; absolute paths and -l
+        # flags are used as given.
+        self._build_lib_paths = {
+            name: info['lib'] if info['lib'].startswith(('/', '-l')) else '../../' + info['lib']
+            for name, info in self.external_libraries.items()
+        }
+        # Targets with both C and C++ sources, which link through their -cpp project
+        self._mixed_language_targets = frozenset(
+            name for name, target in self._targets_by_name.items()
+            if all(_source_languages(target.get('source_files', []) or target.get('sources', []),
+                                     target.get('source_patterns', []))))
+        # Tree-sitter headers every language project can see
+        self._tree_sitter_include_paths = tuple(
+            self.external_libraries[name]['include'] for name in ('tree-sitter', 'tree-sitter-lambda')
+            if name in self.external_libraries and self.external_libraries[name]['include'])
+        self._external_link_kinds = {
+            name: _classify_external_library(info) for name, info in self.external_libraries.items()
+        }
+        self._libraries_by_name = {
+            lib['name']: lib for lib in self.config.get('libraries', [])
+            if isinstance(lib, dict) and 'name' in lib
+        }
+        test_platform_includes, self._test_libdir_lines = self._test_platform_paths()
+        # Regular files per test directory, filled lazily by _test_file_exists
+        self._test_dir_files = {}
+        # Every test executable gets the same includedirs block: consolidated
+        # includes, mem-pool, parsed external libraries, then platform paths
+        test_includes = _dedup_preserve_order(
+            self._get_consolidated_includes() + ("lib/mem-pool/include",) +
+            self._external_include_paths + test_platform_includes)
+        self._test_includedir_lines = (
+            tuple(_list_block('includedirs', test_includes)) if test_includes else ())
 
     def _prepare_macos_archive_without_members(self) -> None:
         """Materialize macOS static archives without private bundled providers."""
@@ -208,188 +613,270 @@ class PremakeGenerator:
         """
         libraries = {}
 
-        # Step 1: Parse global libraries first
-        for lib in self.config.get('libraries', []):
-            # Include all libraries that have a 'name' field
-            if 'name' in lib:
-                libraries[lib['name']] = {
-                    'include': lib.get('include', ''),
-                    'lib': lib.get('lib', ''),
-                    'link': lib.get('link', 'static')
-                }
-
-        # Parse global dev_libraries (development/test-only libraries)
-        for lib in self.config.get('dev_libraries', []):
-            if 'name' in lib:
-                libraries[lib['name']] = {
-                    'include': lib.get('include', ''),
-                    'lib': lib.get('lib', ''),
-                    'link': lib.get('link', 'static')
-                }
+        def apply_entries(entries, default_link, allow_removal):
+            for lib in entries:
+                name = lib.get('name')
+                if name is None:
+                    continue
+                link = lib.get('link', default_link)
+                if allow_removal and link == 'none':
+                    # Platform drops a globally-defined library
+                    libraries.pop(name, None)
+                else:
+                    # Override or add library
+                    libraries[name] = {
+                        'include': lib.get('include', ''),
+                        'lib': lib.get('lib', ''),
+                        'link': link,
+                    }
 
-        # Step 1b: Remove libraries excluded by variant (e.g., cli headless build)
-        if self.variant:
-            variant_config = self.config.get('platforms', {}).get(self.variant, {})
-            exclude_libs = set(variant_config.get('exclude_libraries', []))
-            exclude_macos_libs = set(variant_config.get('exclude_macos_libraries', []))
-            all_excluded = exclude_libs | exclude_macos_libs
-            libraries = {k: v for k, v in libraries.items() if k not in all_excluded}
+        # Step 1: Parse global libraries and dev_libraries (development/test-only)
+        apply_entries(self.config.get('libraries', []), 'static', False)
+        apply_entries(self.config.get('dev_libraries', []), 'static', False)
 
-        # Step 2: Apply platform-specific overrides
         platforms_config = self.config.get('platforms', {})
 
-        # Override with Linux-specific libraries if on Linux
-        if self.use_linux_config:
-            linux_config = platforms_config.get('linux', {})
+        # Step 1b: Remove libraries excluded by variant (e.g., cli headless build)
+        if self.variant:
+            variant_config = platforms_config.get(self.variant, {})
+            for name in (variant_config.get('exclude_libraries', []) +
+                         variant_config.get('exclude_macos_libraries', [])):
+                libraries.pop(name, None)
+
+        # Step 2: Apply platform-specific overrides; macOS links dynamically by default
+        for enabled, platform_key, default_link in (
+                (self.use_linux_config, 'linux', 'static'),
+                (self.use_macos_config, 'macos', 'dynamic'),
+                (self.use_windows_config, 'windows', 'static')):
+            if not enabled:
+                continue
+            platform_config = platforms_config.get(platform_key, {})
+            apply_entries(platform_config.get('libraries', []), default_link, True)
+            apply_entries(platform_config.get('dev_libraries', []), default_link, True)
 
-            # Process Linux-specific libraries
-            for lib in linux_config.get('libraries', []):
-                if 'name' in lib:
-                    if lib.get('link') == 'none':
-                        # Remove library if it was globally defined
-                        if lib['name'] in libraries:
-                            del libraries[lib['name']]
-                    else:
-                        # Override or add library
-                        libraries[lib['name']] = {
-                            'include': lib.get('include', ''),
-                            'lib': lib.get('lib', ''),
-                            'link': lib.get('link', 'static')
-                        }
-
-            # Process Linux-specific dev_libraries
-            for lib in linux_config.get('dev_libraries', []):
-                if 'name' in lib:
-                    if lib.get('link') == 'none':
-                        # Remove library if it was globally defined
-                        if lib['name'] in libraries:
-                            del libraries[lib['name']]
-                    else:
-                        # Override or add library
-                        libraries[lib['name']] = {
-                            'include': lib.get('include', ''),
-                            'lib': lib.get('lib', ''),
-                            'link': lib.get('link', 'static')
-                        }
-
-        # Override with macOS-specific libraries if on macOS
-        if self.use_macos_config:
-            macos_config = platforms_config.get('macos', {})
+        return libraries
 
-            # Process macOS-specific libraries
-            for lib in macos_config.get('libraries', []):
-                if 'name' in lib:
-                    if lib.get('link') == 'none':
-                        # Remove library if it was globally defined
-                        if lib['name'] in libraries:
-                            del libraries[lib['name']]
-                    else:
-                        # Override or add library
-                        libraries[lib['name']] = {
-                            'include': lib.get('include', ''),
-                            'lib': lib.get('lib', ''),
-                            'link': lib.get('link', 'dynamic')  # Default to dynamic on macOS
-                        }
-
-            # Process macOS-specific dev_libraries
-            for lib in macos_config.get('dev_libraries', []):
-                if 'name' in lib:
-                    if lib.get('link') == 'none':
-                        # Remove library if it was globally defined
-                        if lib['name'] in libraries:
-                            del libraries[lib['name']]
-                    else:
-                        # Override or add library
-                        libraries[lib['name']] = {
-                            'include': lib.get('include', ''),
-                            'lib': lib.get('lib', ''),
-                            'link': lib.get('link', 'dynamic')  # Default to dynamic on macOS
-                        }
-
-        # Override with Windows-specific libraries if on Windows
-        if self.use_windows_config:
-            windows_config = platforms_config.get('windows', {})
+    def _test_platform_paths(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Platform include directories and formatted libdirs entries shared by all test projects"""
+        platform = self.config.get('platform', 'macOS')
+        if platform == 'Linux_x64':
+            # Linux cross-compilation paths
+            includes = ("linux-deps/include", "linux-deps/include/ncurses")
+        elif self.use_windows_config:
+            # Windows/MSYS2 paths
+            includes = ("/clang64/include", "win-native-deps/include")
+        else:
+            # macOS paths (default)
+            # IMPORTANT: /opt/homebrew/include must come before /usr/local/include
+            # to ensure Homebrew's gtest headers are found before any system-wide
+            # gtest installation that may have incompatible declarations
+            includes = ("/opt/homebrew/include", "/usr/local/include")
 
-            # Process Windows-specific libraries
-            for lib in windows_config.get('libraries', []):
-                if 'name' in lib:
-                    if lib.get('link') == 'none':
-                        # Remove library if it was globally defined
-                        if lib['name'] in libraries:
-                            del libraries[lib['name']]
-                    else:
-                        # Override or add library
-                        libraries[lib['name']] = {
-                            'include': lib.get('include', ''),
-                            'lib': lib.get('lib', ''),
-                            'link': lib.get('link', 'static')
-                        }
-
-            # Process Windows-specific dev_libraries
-            for lib in windows_config.get('dev_libraries', []):
-                if 'name' in lib:
-                    if lib.get('link') == 'none':
-                        # Remove library if it was globally defined
-                        if lib['name'] in libraries:
-                            del libraries[lib['name']]
-                    else:
-                        # Override or add library
-                        libraries[lib['name']] = {
-                            'include': lib.get('include', ''),
-                            'lib': lib.get('lib', ''),
-                            'link': lib.get('link', 'static')
-                        }
+        if platform == 'Linux_x64':
+            # Linux cross-compilation paths
+            lib_dirs = ("linux-deps/lib", "build/lib")
+        elif self.use_linux_config:
+            # Native Linux paths
+            lib_dirs = ("/usr/local/lib", "/usr/local/lib/aarch64-linux-gnu",
+                        "/usr/lib/aarch64-linux-gnu", "build/lib")
+        elif self.use_windows_config:
+            # Windows/MSYS2 paths
+            lib_dirs = ("/clang64/lib", "win-native-deps/lib", "build/lib")
+        else:
+            # macOS paths (default)
+            lib_dirs = ("/opt/homebrew/lib", "/usr/local/lib", "build/lib")
 
-        return libraries
+        return includes, tuple(_quoted_lines(lib_dirs))
+
+    def _has_runtime_data_dep(self, dependencies: List[str]) -> bool:
+        """Check if any dependency is a runtime/data library or one of its split projects"""
+        prefixes = self._RUNTIME_DATA_DEP_PREFIXES
+        return any(dep in self._RUNTIME_DATA_DEPS or dep.startswith(prefixes)
+                   for dep in dependencies)
 
     def _is_lambda_input_full_dependent_test(self, target_name: str) -> bool:
         """Check if a test target depends on lambda-data libraries"""
-        # Try to match by binary name (with or without .exe and with or without test/ prefix)
+        index = self._test_runtime_dep_index
+        if index is None:
+            index = self._test_runtime_dep_index = self._build_test_runtime_dep_index()
+        binaries, names = index
+        # Match by binary name (with or without .exe and with or without
+        # test/ prefix) or by test name; the earliest matching test decides
         target_binary = target_name + '.exe' if not target_name.endswith('.exe') else target_name
-        target_binary_with_path = 'test/' + target_binary
+        matches = [entry for entry in (binaries.get(target_binary),
+                                       binaries.get('test/' + target_binary),
+                                       names.get(target_name)) if entry]
+        return min(matches)[1] if matches else False
 
-        # Check test_suites - first check if we have 'test' section
-        test_config = self.config.get('test', {})
-        if 'test_suites' in test_config:
-            for suite in test_config['test_suites']:
-                if 'tests' in suite:
-                    for test in suite['tests']:
-                        binary = test.get('binary', '')
-                        name = test.get('name', '')
-                        dependencies = test.get('dependencies', [])
-
-                        # Check multiple variations: exact binary match, binary with path, or name match
-                        if (binary == target_binary or
-                            binary == target_binary_with_path or
-                            name == target_name):
-                            result = any(dep in ['lambda-runtime-full', 'lambda-data'] or
-                                      dep.startswith('lambda-runtime-full-') or
-                                      dep.startswith('lambda-data-')
-                                      for dep in dependencies)
-                            return result
-
-        # Also check top-level test_suites (if any)
-        if 'test_suites' in self.config:
-            for suite in self.config['test_suites']:
-                if 'tests' in suite:
-                    for test in suite['tests']:
-                        binary = test.get('binary', '')
-                        name = test.get('name', '')
-                        # Check multiple variations: exact binary match, binary with path, or name match
-                        if (binary == target_binary or
-                            binary == target_binary_with_path or
-                            name == target_name):
-                            dependencies = test.get('dependencies', [])
-                            result = any(dep in ['lambda-runtime-full', 'lambda-data'] or
-                                      dep.startswith('lambda-runtime-full-') or
-                                      dep.startswith('lambda-data-')
-                                      for dep in dependencies)
-                            return result
+    def _build_test_runtime_dep_index(self) -> tuple[dict, dict]:
+        """Index every configured test by binary and by name
 
-        return False
+        Entries are (position, depends on runtime/data) so that a lookup
+        through several aliases can still honour the first matching test.
+        Tests under the 'test' section come before top-level test_suites.
+        """
+        binaries, names = {}, {}
+        suites = (self.config.get('test', {}).get('test_suites', []) +
+                  self.config.get('test_suites', []))
+        position = 0
+        for suite in suites:
+            for test in suite.get('tests', []):
+                entry = (position, self._has_runtime_data_dep(test.get('dependencies', [])))
+                binaries.setdefault(test.get('binary', ''), entry)
+                names.setdefault(test.get('name', ''), entry)
+                position += 1
+        return binaries, names
+
+    def _test_runtime_link_blocks(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Link lines shared by every test depending on the runtime/data libraries
+
+        Returns the external provider block for tests with a runtime/data
+        dependency and the tree-sitter block for tests depending on
+        lambda-data. Neither varies between tests, so both are built on
+        first use.
+        """
+        if self._test_runtime_link_cache is not None:
+            return self._test_runtime_link_cache
+
+        runtime_data = ['    linkoptions {']
+
+        # Add --start-group only on Linux for circular dependency resolution
+        if self.use_linux_config:
+            runtime_data.append('        "-Wl,--start-group",')
+
+        # Add static external libraries with explicit paths like the main lambda program
+        if self.use_windows_config:
+            # Windows: allow multiple definitions to avoid duplicate _Unwind_Resume from libgcc_eh
+            # This is needed because lambda-data DLL includes exception handling code
+            runtime_data.append('        "-Wl,--allow-multiple-definition",')
+
+            # Windows: use the same explicit paths as the main lambda program
+            windows_lib_paths = [
+                "../../lambda/tree-sitter/libtree-sitter.a",
+                "../../lambda/tree-sitter-lambda/libtree-sitter-lambda.a",
+                "../../win-native-deps/lib/libmir.a",
+                "/clang64/lib/libmpdec.a",
+                "../../win-native-deps/lib/libutf8proc.a",
+                "../../win-native-deps/lib/libcurl.a",
+                "/clang64/lib/libnghttp2.a",
+                "/clang64/lib/libnghttp3.a",
+                "/clang64/lib/libngtcp2_crypto_ossl.a",
+                "/clang64/lib/libngtcp2.a",
+                "/clang64/lib/libssh2.a",
+                "/clang64/lib/libidn2.a",
+                "/clang64/lib/libunistring.a",
+                "/clang64/lib/libiconv.a",
+                "/clang64/lib/libssl.a",
+                "/clang64/lib/libcrypto.a",
+                "/clang64/lib/libzstd.a",
+                "/clang64/lib/libmbedtls.a",
+                "/clang64/lib/libmbedx509.a",
+                "/clang64/lib/libmbedcrypto.a",
+            ]
+            runtime_data.extend(_quoted_lines(windows_lib_paths))
+            # Add dynamic system libraries
+            runtime_data.extend([
+                '        "-lz",',
+                '        "-lbz2",',
+                '        "-lfreetype",',
+                '        "-lpng",',
+                '        "-limm32",',
+                '        "-ldbghelp",',
+                '        "-luserenv",',
+            ])
+            # Non-Windows: use the original approach with external library definitions
+            # If lambda-data is a dependency, we need to include curl/ssl/crypto for proper linking
+            # since static libraries don't propagate their dependencies in Premake,
+            # plus the platform-specific readline library
+            base_libs = self._BASE_STATIC_LIBS + ('libedit',)
+            runtime_data.extend(_quoted_lines(self._static_lib_paths(base_libs)))
+
+        # Add --end-group only on Linux for circular dependency resolution
+        if self.use_linux_config:
+            runtime_data.append('        "-Wl,--end-group",')
+
+        runtime_data.extend([
+            '    }',
+            '',
+            '    -- Add dynamic libraries',
+            '    links {'
+        ])
+
+        # Add dynamic libraries (not frameworks)
+        # (frameworks go in linkoptions; -l prefixes are already stripped)
+        for kind, value in self._external_link_kinds.values():
+            if kind == 'dynamic':
+                runtime_data.append(f'        "{value}",')
+
+        # Add system libraries that libedit depends on (Linux only)
+        if not self.use_windows_config:
+            runtime_data.append('        "ncurses",')
+
+        runtime_data.extend(_CLOSE_BLOCK)
+
+        runtime_data.extend([
+            '    -- Add tree-sitter libraries using linkoptions to append to LIBS section',
+            '    linkoptions {',
+        ])
+
+        runtime_data.extend([
+            '    }',
+            '',
+            '    -- Add macOS frameworks',
+            '    linkoptions {'
+        ])
+
+        # Add macOS frameworks using linkoptions
+        for lib_name, (kind, _) in self._external_link_kinds.items():
+            if kind == 'framework':
+                runtime_data.append(f'        "{self.external_libraries[lib_name]["lib"]}",')
+
+        runtime_data.extend(_CLOSE_BLOCK)
+
+        # Use platform-specific flags to force inclusion of all symbols from tree-sitter libraries.
+        # No --gc-sections/-dead_strip here: section GC would discard exactly the
+        # members these flags keep live. Release configurations already compile
+        # with -ffunction-sections/-fdata-sections and link with section GC at
+        # workspace level, which covers test executables too.
+        tree_sitter = [
+            '    filter {}',
+            '    linkoptions {',
+        ]
+
+        if self.use_linux_config:
+            # Linux: use --whole-archive
+            tree_sitter.append('        "-Wl,--whole-archive",')
+            # lambda-data references the LaTeX parser entry points from
+            # its archive, so these archives must remain live after the
+            # data library is placed on the link line.
+            for lib_name in self._TREE_SITTER_LIBS + self._TREE_SITTER_LATEX_LIBS:
+                if lib_name in self.external_libraries:
+                    lib_path = self._build_lib_paths[lib_name]
+                    tree_sitter.append(f'        "{lib_path}",')
+            tree_sitter.append('        "-Wl,--no-whole-archive",')
+        elif self.use_macos_config:
+            # macOS: use -force_load for each library
+            for lib_name in self._TREE_SITTER_LIBS:
+                if lib_name in self.external_libraries:
+                    lib_path = self._build_lib_paths[lib_name]
+                    tree_sitter.append(f'        "-Wl,-force_load,{lib_path}",')
+        else:
+            # Default: just link normally without forcing symbol inclusion
+            for lib_name in self._TREE_SITTER_LIBS:
+                if lib_name in self.external_libraries:
+                    lib_path = self._build_lib_paths[lib_name]
+                    tree_sitter.append(f'        "{lib_path}",')
+
+        tree_sitter.extend(_CLOSE_BLOCK)
+
+        self._test_runtime_link_cache = (tuple(runtime_data), tuple(tree_sitter))
+        return self._test_runtime_link_cache
 
     def _get_compiler_info(self) -> tuple[str, str]:
         """Get compiler and toolset information based on platform configuration"""
+        if self._compiler_info_cache is not None:
+            return self._compiler_info_cache
+
         # Get compiler from config - check for platform-specific config first
         platforms_config = self.config.get('platforms', {})
 
@@ -423,15 +910,24 @@ class PremakeGenerator:
         }
         toolset = toolset_map.get(base_compiler, 'clang')
 
-        return base_compiler, toolset
+        self._compiler_info_cache = (base_compiler, toolset)
+        return self._compiler_info_cache
+
+    def _get_build_options(self) -> List[str]:
+        """Get compiler-specific build options for the configured compiler
+
+        The options only depend on the loaded configuration, so they are
+        computed once per generator; callers receive a fresh list they may extend.
+        """
+        if self._build_options_cache is not None:
+            return list(self._build_options_cache)
+        base_compiler, _ = self._get_compiler_info()
 
-    def _get_build_options(self, base_compiler: str) -> List[str]:
-        """Get compiler-specific build options"""
         build_opts = ['-pedantic']
 
         # Add compiler-specific flags
-        if base_compiler in ['gcc', 'g++']:
-            build_opts.extend(['-fdiagnostics-color=auto'])
+        if base_compiler in ('gcc', 'g++'):
+            build_opts.append('-fdiagnostics-color=auto')
             # gcc doesn't need -fms-extensions and doesn't support -fcolor-diagnostics
         elif base_compiler == 'clang':
             # color=auto (not forced -fcolor-diagnostics) so diagnostics stay
@@ -444,33 +940,25 @@ class PremakeGenerator:
         for flag in global_flags:
             if flag.startswith('D'):  # Define preprocessor flags
                 build_opts.append(f'-{flag}')
-            elif flag not in ['pedantic', 'fdiagnostics-color=auto', 'fms-extensions']:  # Avoid duplicates
+            elif flag not in self._BUILTIN_COMPILER_FLAGS:  # Avoid duplicates
                 build_opts.append(f'-{flag}')
 
         # Add platform-specific flags
         platforms_config = self.config.get('platforms', {})
+        platform_flags = []
         if self.use_windows_config:
-            windows_config = platforms_config.get('windows', {})
-            platform_flags = windows_config.get('flags', [])
-            for flag in platform_flags:
-                opt = f'-{flag}' if not flag.startswith('-') else flag
-                if opt not in build_opts:
-                    build_opts.append(opt)
+            platform_flags = platforms_config.get('windows', {}).get('flags', [])
         elif self.use_linux_config:
-            linux_config = platforms_config.get('linux', {})
-            platform_flags = linux_config.get('flags', [])
-            for flag in platform_flags:
-                opt = f'-{flag}' if not flag.startswith('-') else flag
-                if opt not in build_opts:
-                    build_opts.append(opt)
+            platform_flags = platforms_config.get('linux', {}).get('flags', [])
         elif self.use_macos_config:
-            macos_config = platforms_config.get('macos', {})
-            platform_flags = macos_config.get('flags', [])
-            for flag in platform_flags:
-                opt = f'-{flag}' if not flag.startswith('-') else flag
-                if opt not in build_opts:
-                    build_opts.append(opt)
-
+            platform_flags = platforms_config.get('macos', {}).get('flags', [])
+        if platform_flags:
+            # Platform flags are added once each, skipping any already present
+            existing_opts = set(build_opts)
+            platform_opts = dict.fromkeys(flag if flag[:1] == '-' else '-' + flag for flag in platform_flags)
+            build_opts.extend(opt for opt in platform_opts if opt not in existing_opts)
+
+        self._build_options_cache = tuple(build_opts)
         return build_opts
 
     def _apply_variant_overlay(self, variant: str) -> None:
@@ -516,8 +1004,11 @@ class PremakeGenerator:
             self.config['libraries'] = existing_libs
             vlog(f"DEBUG: Variant added {len(variant_config['additional_libraries'])} additional libraries")
 
-    def _get_consolidated_includes(self) -> List[str]:
+    def _get_consolidated_includes(self) -> Tuple[str, ...]:
         """Get consolidated include directories from global and platform-specific configurations"""
+        if self._consolidated_includes_cache is not None:
+            return self._consolidated_includes_cache
+
         includes = []
 
         # Add global includes first
@@ -541,25 +1032,12 @@ class PremakeGenerator:
             includes.extend(windows_includes)
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_includes = []
-        for include in includes:
-            if include and include not in seen:
-                unique_includes.append(include)
-                seen.add(include)
-
-        return unique_includes
+        self._consolidated_includes_cache = tuple(_dedup_preserve_order(includes))
+        return self._consolidated_includes_cache
 
     def parse_config(self) -> Dict[str, Any]:
-        """Parse build_lambda_config.json and extract configuration"""
-        try:
-            return self.config
-        except FileNotFoundError:
-            elog(f"Error: Configuration file not found")
-            sys.exit(1)
-        except json.JSONDecodeError as e:
-            elog(f"Error: Invalid JSON: {e}")
-            sys.exit(1)
+        """Return the configuration loaded by the constructor"""
+        return self.config
 
     def _get_platform_info(self) -> tuple[str, List[str]]:
         """Get platform and architecture information"""
@@ -612,6 +1090,39 @@ class PremakeGenerator:
         _, standard, _ = self._get_language_info(target)
         return standard
 
+    def _fast_linker_flag(self) -> Optional[str]:
+        """Get the -fuse-ld flag for a faster Linux linker, if enabled and installed
+
+        Opt-in through platforms.linux.fast_linker; mold is preferred over lld.
+        """
+        linux_config = self.config.get('platforms', {}).get('linux', {})
+        if not self.use_linux_config or not linux_config.get('fast_linker', False):
+            return None
+        if shutil.which('mold'):
+            return '-fuse-ld=mold'
+        if shutil.which('ld.lld') or shutil.which('lld'):
+            return '-fuse-ld=lld'
+        elog("Warning: platforms.linux.fast_linker is set but neither mold nor lld was found; using the default linker")
+        return None
+
+    def _emit(self, lines) -> None:
+        """Write a finished section to the premake output.
+
+        Sections are assembled in a local list and written once, or passed as
+        one preformatted multi-line string (e.g. a filled-in template);
+        consecutive sections are separated by a single newline, as if every
+        line had been joined together at the end. The output is the premake
+        file itself while generate_premake_file runs, or an in-memory buffer
+        otherwise.
+        """
+        if not lines:
+            return
+        out = self.premake_content
+        if self._emitted_sections:
+            out.write('\n')
+        out.write(lines if isinstance(lines, str) else '\n'.join(lines))
+        self._emitted_sections += 1
+
     def generate_workspace(self) -> None:
         """Generate the main workspace configuration"""
         vlog("DEBUG: Generating workspace configuration...")
@@ -641,35 +1152,9 @@ class PremakeGenerator:
             location = 'build/premake'
         vlog(f"DEBUG: platform_config={platform_config}, location={location}")
 
-        self.premake_content.extend([
-            f'workspace "{workspace_name}"',
-            '    configurations { "debug", "debug_profile", "release", "release_profile" }',
-            f'    platforms {{ {platform_str} }}',
-            f'    location "{location}"',
-            f'    startproject "{startup_project}"',
-            f'    toolset "{toolset}"',
-            '    ',
-            '    -- Global settings',
-            '    cppdialect "C++17"',
-            '    cdialect "C11"',
-            '    warnings "Extra"',
-            '    ',
-        ])
-
-        self.premake_content.extend([
-            '    filter "configurations:debug"',
-            '        defines { "DEBUG" }',
-            '        symbols "On"',
-            '        -- -Og keeps debugging practical while avoiding the O0 runtime penalty.',
-            '        buildoptions { "-Og", "-fno-omit-frame-pointer" }',
-            '    ',
-            '    filter "configurations:debug_profile"',
-            '        -- Preserve debugger symbols while profiling optimized JS execution.',
-            '        defines { "DEBUG", "LAMBDA_JS_EXEC_PROFILE" }',
-            '        symbols "On"',
-            '        optimize "Speed"',
-            '        buildoptions { "-fno-omit-frame-pointer" }',
-        ])
+        lines = [_WORKSPACE_HEADER_TEMPLATE.format(
+            name=workspace_name, platforms=platform_str, location=location,
+            startproject=startup_project, toolset=toolset)]
 
         # Add Windows-specific linker flags to debug configuration
         if self.use_windows_config:
@@ -679,28 +1164,14 @@ class PremakeGenerator:
             vlog(f"DEBUG: Adding Windows linker flags to Debug configuration: {linker_flags}")
 
             if linker_flags:
-                self.premake_content.append('        linkoptions {')
-                for flag in linker_flags:
-                    if flag.startswith('l'):
-                        # Library flags start with 'l' (like lwinmm)
-                        self.premake_content.append(f'            "-{flag}",')
-                        vlog(f"DEBUG: Added Windows library flag to Debug: -{flag}")
-                    elif flag.startswith('Wl,'):
-                        # Linker options start with 'Wl,'
-                        self.premake_content.append(f'            "-{flag}",')
-                        vlog(f"DEBUG: Added Windows linker option to Debug: -{flag}")
-                    else:
-                        # Other flags like 'static', 'static-libgcc'
-                        self.premake_content.append(f'            "-{flag}",')
-                        vlog(f"DEBUG: Added Windows other flag to Debug: -{flag}")
-                self.premake_content.extend([
-                    '        }',
-                ])
+                # Library flags (lwinmm), linker options (Wl,...) and plain
+                # driver flags (static-libgcc) all just gain a leading dash
+                lines.append('        linkoptions {')
+                lines.extend(f'            "-{flag}",' for flag in linker_flags)
+                lines.append('        }')
                 vlog("DEBUG: Added Windows linker flags to Debug configuration")
 
-        self.premake_content.extend([
-            '    ',
-        ])
+        lines.append('')
 
         vlog("DEBUG: Added Debug configuration filter")
 
@@ -709,9 +1180,10 @@ class PremakeGenerator:
         linux_config = platforms_config.get('linux', {})
         disable_sanitizer = linux_config.get('disable_sanitizer', False)
 
-        vlog(f"DEBUG: platforms_config keys: {list(platforms_config.keys())}")
-        vlog(f"DEBUG: linux_config: {linux_config}")
-        vlog(f"DEBUG: disable_sanitizer: {disable_sanitizer}")
+        if _VERBOSE:
+            vlog(f"DEBUG: platforms_config keys: {list(platforms_config.keys())}")
+            vlog(f"DEBUG: linux_config: {linux_config}")
+            vlog(f"DEBUG: disable_sanitizer: {disable_sanitizer}")
 
         # AddressSanitizer is applied to the main lambda.exe debug build via
         # enable_sanitizer_main. Test executables default to the fastest debug
@@ -719,21 +1191,27 @@ class PremakeGenerator:
         if not disable_sanitizer:
             vlog("DEBUG: AddressSanitizer is available for opt-in debug targets")
         else:
-            self.premake_content.extend([
+            lines.extend([
                 '    -- AddressSanitizer disabled for Linux platform',
-                '    ',
+                '',
             ])
             vlog("DEBUG: AddressSanitizer disabled")
 
         # Release configuration with size optimizations
-        # Use -flto=thin (ThinLTO) on macOS/Clang and Linux/Clang, -flto on Linux/GCC
-        linux_uses_clang = self.use_linux_config and base_compiler == 'clang'
-        lto_flag = '"-flto=thin"' if (self.use_macos_config or linux_uses_clang) else '"-flto"'
+        # Use -flto=thin (ThinLTO) on macOS and with Clang elsewhere (including
+        # the MSYS2 clang64 toolchain on Windows, whose default linker is lld);
+        # GCC only understands full -flto
+        uses_thin_lto = self.use_macos_config or base_compiler == 'clang'
+        lto_flag = '"-flto=thin"' if uses_thin_lto else '"-flto"'
         has_hosted_language_module = any(
             target.get('link') == 'dynamic' and target.get('name', '').startswith('lang-')
             for target in self.config.get('targets', [])
         )
 
+        # Linux/Clang release links pick lld themselves for ThinLTO
+        release_uses_lld = (self.use_linux_config and base_compiler == 'clang' and
+                            (shutil.which('lld') is not None or shutil.which('ld.lld') is not None))
+
         def add_release_link_options(strip_locals=True):
             # strip_locals=False is for release_profile: stripping local symbols
             # makes static functions unresolvable in a sampled profile (they
@@ -745,7 +1223,7 @@ class PremakeGenerator:
                 '            -- local symbols deliberately kept for profiling',
             ]
             if self.use_macos_config:
-                self.premake_content.extend([
+                lines.extend([
                     '        -- macOS: strip dead code and symbols with ThinLTO',
                     '        linkoptions {',
                     '            "-flto=thin",',
@@ -764,11 +1242,8 @@ class PremakeGenerator:
                 ])
             elif self.use_linux_config:
                 if base_compiler == 'clang':
-                    # check if lld is available for ThinLTO
-                    import shutil
-                    has_lld = shutil.which('lld') is not None or shutil.which('ld.lld') is not None
-                    if has_lld:
-                        self.premake_content.extend([
+                    if release_uses_lld:
+                        lines.extend([
                             '        -- Linux/Clang: strip dead code and symbols with ThinLTO + LLD',
                             '        linkoptions {',
                             '            "-flto=thin",',
@@ -778,7 +1253,7 @@ class PremakeGenerator:
                             '        }',
                         ])
                     else:
-                        self.premake_content.extend([
+                        lines.extend([
                             '        -- Linux/Clang: strip dead code and symbols (lld not available, using default linker)',
                             '        linkoptions {',
                             '            "-flto",',
@@ -787,7 +1262,7 @@ class PremakeGenerator:
                             '        }',
                         ])
                 else:
-                    self.premake_content.extend([
+                    lines.extend([
                         '        -- Linux/GCC: strip dead code and symbols with LTO',
                         '        linkoptions {',
                         '            "-flto",',
@@ -796,10 +1271,10 @@ class PremakeGenerator:
                         '        }',
                     ])
             elif self.use_windows_config:
-                self.premake_content.extend([
+                lines.extend([
                     '        -- Windows: strip dead code with LTO + platform flags',
                     '        linkoptions {',
-                    '            "-flto",',
+                    f'            {lto_flag},',
                     '            "-Wl,--gc-sections",',
                 ] + (['            "-s",  -- Strip symbols'] if strip_locals else [
                     '            -- symbols deliberately kept for profiling',
@@ -821,7 +1296,7 @@ class PremakeGenerator:
         host_machine = platform.machine().lower()
         native_isa_flag = '"-mcpu=native"' if self.use_linux_config and \
             host_machine in ('aarch64', 'arm64') else '"-march=native"'
-        self.premake_content.extend([
+        lines.extend([
             '    filter "configurations:release"',
             '        defines { "NDEBUG", "LAMBDA_HOME_RELEASE" }',
             '        -- LAMBDA_HOME_RELEASE: release binary loads assets from ./lmd/ instead of ./lambda/',
@@ -841,8 +1316,8 @@ class PremakeGenerator:
         ])
         add_release_link_options()
 
-        self.premake_content.extend([
-            '    ',
+        lines.extend([
+            '',
             '    filter "configurations:release_profile"',
             '        defines { "NDEBUG", "LAMBDA_HOME_RELEASE", "LAMBDA_JS_EXEC_PROFILE" }',
             '        -- LAMBDA_JS_EXEC_PROFILE: keep JS execution instrumentation in an optimized build',
@@ -862,31 +1337,46 @@ class PremakeGenerator:
         # static functions without them, and profiling is this config's purpose.
         add_release_link_options(strip_locals=False)
 
-        self.premake_content.extend([
-            '    ',
-        ])
+        lines.append('')
 
         # Note: Windows linker flags are now added to Debug configuration above, not globally
         if self.use_linux_config or platform_config == 'Linux_x64' or 'linux' in output.lower():
-            self.premake_content.extend([
+            lines.extend([
                 '    -- Native Linux build settings',
                 f'    toolset "{toolset}"',
                 '    defines { "LINUX", "_GNU_SOURCE", "NATIVE_LINUX_BUILD" }',
-                '    ',
+                '',
             ])
 
             # Add library search paths for Linux dependencies
             lib_dirs = self.config.get('lib_dirs', self.config.get('library_dirs', []))
             if lib_dirs:
                 lib_dirs_str = ', '.join([f'"{d}"' for d in lib_dirs])
-                self.premake_content.append(f'        libdirs {{ {lib_dirs_str} }}')
+                lines.append(f'        libdirs {{ {lib_dirs_str} }}')
 
-        self.premake_content.extend([
-            '    ',
+        lines.extend([
+            '',
             '    filter {}',
-            ''
         ])
 
+        # Applies to every configuration, so it goes after the filter reset.
+        # Release links keep their own linker when their options already
+        # select lld (a second -fuse-ld would silently override it) or when
+        # lld would have to link GCC's LTO objects, which it cannot read.
+        fast_linker_flag = self._fast_linker_flag()
+        if fast_linker_flag:
+            lines.append('    -- Faster linker (opt-in via platforms.linux.fast_linker)')
+            if release_uses_lld or (fast_linker_flag == '-fuse-ld=lld' and base_compiler != 'clang'):
+                lines.extend([
+                    '    filter "configurations:debug or debug_profile"',
+                    f'        linkoptions {{ "{fast_linker_flag}" }}',
+                    '    filter {}',
+                ])
+            else:
+                lines.append(f'    linkoptions {{ "{fast_linker_flag}" }}')
+        lines.append('')
+        self._emit(lines)
+
     def generate_library_projects(self) -> None:
         """Generate static library projects from JSON config"""
         # Handle new lib_project format (for cross-platform builds)
@@ -894,21 +1384,8 @@ class PremakeGenerator:
         if lib_project:
             self._generate_lib_project(lib_project)
 
-        # Handle old libraries format (backward compatibility)
-        libraries = self.config.get('libraries', [])
-
-        for lib in libraries:
-            # Handle both string and object formats
-            if isinstance(lib, str):
-                # String format: just library name, skip processing
-                continue
-            elif isinstance(lib, dict):
-                lib_name = lib.get('name', '')
-                link_type = lib.get('link', 'static')
-
-                # Skip external libraries
-                if link_type in ['dynamic', 'static'] and 'sources' not in lib:
-                    continue
+        # Entries of the old 'libraries' list describe external libraries
+        # only (parsed into self.external_libraries); they emit no projects.
 
     def _generate_lib_project(self, lib_project: Dict[str, Any]) -> None:
         """Generate a static library project from lib_project configuration"""
@@ -918,118 +1395,73 @@ class PremakeGenerator:
         target_dir = lib_project.get('target_dir', 'build/lib')
         files = lib_project.get('files', [])
 
-        self.premake_content.extend([
+        lines = [
             '',
-            f'project "{name}"',
-            f'    kind "{kind}"',
-            f'    language "{language}"',
-            f'    targetdir "{target_dir}"',
-            f'    objdir "build/obj/%{{prj.name}}"',
-            '    ',
-        ])
+            _PROJECT_HEADER_TEMPLATE.format(name=name, kind=kind, language=language, target_dir=target_dir),
+            '',
+        ]
 
         # Add source files
         if files:
-            self.premake_content.append('    files {')
-            for file in files:
-                self.premake_content.append(f'        "{file}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('files', files))
 
         # Add include directories
         consolidated_includes = self._get_consolidated_includes()
         include_dirs = self.config.get('include_dirs', [])
 
         # Combine legacy include_dirs with new consolidated includes
-        all_includes = consolidated_includes + include_dirs
+        all_includes = list(consolidated_includes) + include_dirs
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_includes = []
-        for include in all_includes:
-            if include and include not in seen:
-                unique_includes.append(include)
-                seen.add(include)
+        unique_includes = _dedup_preserve_order(all_includes)
 
         if unique_includes:
-            self.premake_content.append('    includedirs {')
-            for include_dir in unique_includes:
-                self.premake_content.append(f'        "{include_dir}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('includedirs', unique_includes))
 
         # Add library directories
         lib_dirs = self.config.get('lib_dirs', [])
         if lib_dirs:
-            self.premake_content.append('    libdirs {')
-            for lib_dir in lib_dirs:
-                self.premake_content.append(f'        "{lib_dir}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('libdirs', lib_dirs))
 
         # Add build options
         cflags = self.config.get('cflags', [])
         cxxflags = self.config.get('cxxflags', [])
 
         if cflags:
-            self.premake_content.extend([
+            lines.extend([
                 '    filter "files:**.c"',
                 '        buildoptions {'
             ])
-            for flag in cflags:
-                self.premake_content.append(f'            "{flag}",')
-            self.premake_content.extend([
-                '        }',
-                '    '
-            ])
+            lines.extend(_quoted_lines(cflags, indent=12))
+            lines.extend(_CLOSE_NESTED_BLOCK)
 
         if cxxflags:
-            self.premake_content.extend([
+            lines.extend([
                 '    filter "files:**.cpp"',
                 '        buildoptions {'
             ])
-            for flag in cxxflags:
-                self.premake_content.append(f'            "{flag}",')
-            self.premake_content.extend([
-                '        }',
-                '    '
-            ])
+            lines.extend(_quoted_lines(cxxflags, indent=12))
+            lines.extend(_CLOSE_NESTED_BLOCK)
 
         # Add defines
         defines = self.config.get('defines', [])
         if defines:
-            self.premake_content.extend([
-                '    defines {'
-            ])
-            for define in defines:
-                self.premake_content.append(f'        "{define}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('defines', defines))
 
         # Add platform-specific settings
         platform = self.config.get('platform', '')
         if platform == 'Linux_x64':
-            self.premake_content.extend([
+            lines.extend([
                 f'    filter "platforms:{platform}"',
                 '        system "linux"',
                 '        architecture "x64"',
                 '        toolset "gcc"',
                 '        gccprefix "x86_64-linux-gnu-"',
-                '    '
+                ''
             ])
 
-        self.premake_content.extend([
-            '    filter {}',
-            '    '
-        ])
+        lines.extend(_RESET_FILTER_BLOCK)
+        self._emit(lines)
 
     def generate_complex_libraries(self) -> None:
         """Generate complex library projects and executable targets"""
@@ -1056,19 +1488,35 @@ class PremakeGenerator:
         excluded = set(platform_overrides.get('exclude_libraries', []))
         return [library for library in libraries if library not in excluded]
 
-    def _external_library_for_target(self, target: Dict[str, Any], name: str) -> Dict[str, Any]:
-        """Apply a target-local link override without changing executable linkage."""
-        library = self.external_libraries[name]
+    def _external_overrides_for_target(self, target: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Target-local external library overrides, by library name
+
+        They change how this target links a library without changing
+        executable linkage.
+        """
         overrides = {}
         if target.get('validation_source_target'):
             overrides.update(self.config.get('validation_external_library_overrides', {}))
         overrides.update(target.get('external_library_overrides', {}))
-        override = overrides.get(name, {})
-        if not override:
-            return library
-        resolved = dict(library)
-        resolved.update(override)
-        return resolved
+        return overrides
+
+    def _static_lib_paths(self, lib_names: List[str]) -> List[str]:
+        """Return link paths for the static external libraries in lib_names.
+
+        Unknown, dynamic and "none" libraries are skipped. Relative archives
+        are made relative to the build directory.
+        """
+        force_load = not self.use_windows_config and not self.use_linux_config
+        paths = []
+        for lib_name in lib_names:
+            lib_info = self.external_libraries.get(lib_name)
+            if not lib_info or lib_info['link'] in ('none', 'dynamic') or not lib_info['lib']:
+                continue
+            lib_path = self._build_lib_paths[lib_name]
+            if force_load and lib_name in self._MACOS_FORCE_LOAD_LIBS:
+                lib_path = f'-Wl,-force_load,{lib_path}'
+            paths.append(lib_path)
+        return paths
 
     def _executable_external_dependencies(self, target: Dict[str, Any]) -> List[str]:
         """Return the ordered static/dynamic external closure for an executable.
@@ -1082,10 +1530,7 @@ class PremakeGenerator:
         ordered = []
         seen_targets = set()
         seen_external = set()
-        configured_targets = {
-            item.get('name'): item for item in self.config.get('targets', [])
-            if item.get('name')
-        }
+        configured_targets = self._targets_by_name
 
         def visit(current: Dict[str, Any]) -> None:
             name = current.get('name')
@@ -1113,9 +1558,14 @@ class PremakeGenerator:
         source_patterns = lib.get('source_patterns', [])
         dependencies = self._target_libraries_for_platform(lib)
 
-        # Separate C and C++ files
-        c_files = [f for f in source_files if f.endswith('.c')]
-        cpp_files = [f for f in source_files if f.endswith('.cpp')]
+        # Separate C and C++ files in one pass; other sources (headers,
+        # assembly) belong to neither list
+        c_files, cpp_files = [], []
+        files_by_ext = {'.c': c_files, '.cpp': cpp_files}
+        for source_file in source_files:
+            bucket = files_by_ext.get(os.path.splitext(source_file)[1])
+            if bucket is not None:
+                bucket.append(source_file)
         has_c_pattern = any('*.c' in pattern for pattern in source_patterns)
         has_cpp_pattern = any('*.cpp' in pattern for pattern in source_patterns)
 
@@ -1129,7 +1579,7 @@ class PremakeGenerator:
             self._create_wrapper_project(lib_name, [f"{lib_name}-cpp"], lib)
         else:
             # Single language project
-            language = "C++" if cpp_files or any('*.cpp' in pattern for pattern in source_patterns) else "C"
+            language = "C++" if cpp_files or has_cpp_pattern else "C"
             self._create_language_project(lib, source_files, source_patterns, dependencies, language, lib_name)
 
     def _create_language_project(self, lib: Dict[str, Any], source_files: List[str],
@@ -1138,6 +1588,9 @@ class PremakeGenerator:
         """Create a single-language project"""
         # Get language info from the lib target configuration
         detected_language, standard, needs_cpp_stdlib = self._get_language_info(lib)
+        # The library's own standard, before any split-project override below;
+        # reused wherever the library's C or C++ standard is needed.
+        lib_standard = standard
 
         # For split projects (with -c or -cpp suffix), respect the passed language parameter
         # Otherwise, use detected language from configuration
@@ -1171,51 +1624,47 @@ class PremakeGenerator:
         else:
             kind = "SharedLib" if link_type == 'dynamic' else "StaticLib"
 
-        self.premake_content.extend([
-            f'project "{project_name}"',
-            f'    kind "{kind}"',
-            f'    language "{final_language}"',
-            f'    targetdir "{lib.get("target_dir", "build/lib")}"',
-            '    objdir "build/obj/%{prj.name}"',
-            '    ',
-        ])
+        lines = [
+            _PROJECT_HEADER_TEMPLATE.format(name=project_name, kind=kind, language=final_language,
+                                            target_dir=lib.get("target_dir", "build/lib")),
+            '',
+        ]
 
         target_name = lib.get('target_name')
         if target_name:
-            self.premake_content.append(f'    targetname "{target_name}"')
+            lines.append(f'    targetname "{target_name}"')
         if 'target_prefix' in lib:
-            self.premake_content.append(f'    targetprefix "{lib["target_prefix"]}"')
+            lines.append(f'    targetprefix "{lib["target_prefix"]}"')
         if target_name or 'target_prefix' in lib:
-            self.premake_content.append('    ')
+            lines.append('')
 
         # Add source files
         if source_files:
-            self.premake_content.append('    files {')
-            for source in source_files:
-                self.premake_content.append(f'        "{source}",')
-            self.premake_content.append('    }')
-            self.premake_content.append('    ')
+            lines.append('    files {')
+            lines.extend(_quoted_lines(source_files))
+            lines.append('    }')
+            lines.append('')
 
         # Premake's gmake action does not create Objective-C++ rules for .mm
         # files. Platform shims use C++ wrapper TUs marked here so the normal
         # C++ object rule invokes clang in Objective-C++ mode on those files.
         objcxx_sources = lib.get('objcxx_source_files', [])
         for source in objcxx_sources:
-            self.premake_content.extend([
+            lines.extend([
                 f'    filter "files:{source}"',
                 '        buildoptions { "-x", "objective-c++" }',
                 '    filter {}',
-                '    '
+                ''
             ])
 
         # Add source patterns
         if source_patterns:
             for pattern in source_patterns:
-                self.premake_content.extend([
+                lines.extend([
                     '    files {',
                     f'        "{pattern}",',
                     '    }',
-                    '    '
+                    ''
                 ])
 
         # Add target exclusions plus Linux platform exclusions. Library targets
@@ -1226,15 +1675,7 @@ class PremakeGenerator:
             linux_config = self.config.get('platforms', {}).get('linux', {})
             exclude_patterns.extend(linux_config.get('exclude_source_files', []))
         if exclude_patterns:
-            self.premake_content.extend([
-                '    removefiles {',
-            ])
-            for exclude_pattern in exclude_patterns:
-                self.premake_content.append(f'        "{exclude_pattern}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('removefiles', exclude_patterns))
 
         # Add include directories
         all_includes = []
@@ -1248,11 +1689,7 @@ class PremakeGenerator:
             all_includes.append(lib['include'])
 
         # Add tree-sitter includes
-        for lib_name in ['tree-sitter', 'tree-sitter-lambda']:
-            if lib_name in self.external_libraries:
-                include_path = self.external_libraries[lib_name]['include']
-                if include_path:
-                    all_includes.append(include_path)
+        all_includes.extend(self._tree_sitter_include_paths)
 
         # Add other external library includes
         for lib_name in dependencies:
@@ -1262,27 +1699,13 @@ class PremakeGenerator:
                     all_includes.append(include_path)
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_includes = []
-        for include in all_includes:
-            if include and include not in seen:
-                unique_includes.append(include)
-                seen.add(include)
+        unique_includes = _dedup_preserve_order(all_includes)
 
         if unique_includes:
-            self.premake_content.extend([
-                '    includedirs {',
-            ])
-            for include_path in unique_includes:
-                self.premake_content.append(f'        "{include_path}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('includedirs', unique_includes))
 
         # Add build options
-        base_compiler, _ = self._get_compiler_info()
-        build_opts = self._get_build_options(base_compiler)
+        build_opts = self._get_build_options()
         # Static archives also provide host symbols to dynamically linked
         # runtime tests; hiding them prevents the executable from satisfying
         # the runtime DSO's intentionally deferred host imports.
@@ -1294,43 +1717,31 @@ class PremakeGenerator:
             build_opts.append('-fPIC')
 
         # Check if this project has mixed C/C++ files
-        c_files_present = any(f.endswith('.c') for f in source_files) or any(
-            '*.c' in pattern for pattern in source_patterns)
-        cpp_files_present = any(f.endswith('.cpp') for f in source_files) or any(
-            '*.cpp' in pattern for pattern in source_patterns)
+        c_files_present, cpp_files_present = _source_languages(source_files, source_patterns)
 
         if c_files_present and cpp_files_present and final_language == "C++":
             # Mixed project: use file-specific build options
             c_build_opts = build_opts + ['-std=c17']  # Default C standard for mixed projects
-            cpp_standard = self._get_cpp_standard(lib)
-            cpp_build_opts = build_opts + [f'-std={cpp_standard}']
+            cpp_build_opts = build_opts + [f'-std={lib_standard}']
 
             # C file build options
-            self.premake_content.extend([
+            lines.extend([
                 '    filter "files:**.c"',
                 '        buildoptions {',
             ])
-            for opt in c_build_opts:
-                self.premake_content.append(f'            "{opt}",')
-            self.premake_content.extend([
+            lines.extend(_quoted_lines(c_build_opts, indent=12))
+            lines.extend([
                 '        }',
-                '    ',
+                '',
                 '    filter "files:**.cpp"',
                 '        buildoptions {',
             ])
-            for opt in cpp_build_opts:
-                self.premake_content.append(f'            "{opt}",')
-            self.premake_content.extend([
-                '        }',
-                '    ',
-                '    filter {}',
-                '    '
-            ])
+            lines.extend(_quoted_lines(cpp_build_opts, indent=12))
+            lines.extend(_CLOSE_NESTED_FILTER_BLOCK)
         else:
             # Pure language project: use global build options
             if final_language == "C++":
-                cpp_standard = self._get_cpp_standard(lib)
-                build_opts.append(f'-std={cpp_standard}')
+                build_opts.append(f'-std={lib_standard}')
             elif final_language == "C":
                 # Add C standard support - use the corrected standard for split projects
                 if project_name.endswith('-c'):
@@ -1338,24 +1749,18 @@ class PremakeGenerator:
                     build_opts.append(f'-std={standard}')
                 else:
                     # For regular C projects, get from library config
-                    _, c_standard, _ = self._get_language_info(lib)
-                    build_opts.append(f'-std={c_standard}')
+                    build_opts.append(f'-std={lib_standard}')
 
             # Add Windows DLL export flags for lambda-data projects - moved to linkoptions
             # if (self.use_windows_config and link_type == 'dynamic' and
             #     project_name.startswith('lambda-data')):
             #     build_opts.extend(['-Wl,--export-all-symbols', '-Wl,--enable-auto-import'])
 
-            self.premake_content.extend([
-                '    buildoptions {',
-            ])
-            for i, opt in enumerate(build_opts):
-                comma = ',' if i < len(build_opts) - 1 else ''
-                self.premake_content.append(f'        "{opt}"{comma}')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.append('    buildoptions {')
+            # Single-language projects leave the last option without a comma
+            if build_opts:
+                lines.append('        "' + '",\n        "'.join(build_opts) + '"')
+            lines.extend(_CLOSE_BLOCK)
 
         # Add library dependencies
         if dependencies:
@@ -1365,10 +1770,7 @@ class PremakeGenerator:
             # Separate internal and external dependencies
             internal_deps = []
             external_deps = []
-            configured_targets = {
-                target.get('name'): target for target in self.config.get('targets', [])
-                if target.get('name')
-            }
+            configured_targets = self._targets_by_name
 
             for dep in dependencies:
                 if dep in self.external_libraries:
@@ -1376,16 +1778,10 @@ class PremakeGenerator:
                 else:
                     target = configured_targets.get(dep)
                     if target:
-                        target_sources = target.get('source_files', []) or target.get('sources', [])
-                        target_patterns = target.get('source_patterns', [])
-                        has_c = any(path.endswith('.c') for path in target_sources) or any(
-                            '*.c' in pattern for pattern in target_patterns)
-                        has_cpp = any(path.endswith('.cpp') for path in target_sources) or any(
-                            '*.cpp' in pattern for pattern in target_patterns)
                         # Mixed targets have an empty wrapper archive; final
                         # consumers must link the concrete mixed-language
                         # project or none of its object files are reachable.
-                        internal_deps.append(f'{dep}-cpp' if has_c and has_cpp else dep)
+                        internal_deps.append(f'{dep}-cpp' if dep in self._mixed_language_targets else dep)
                     else:
                         internal_deps.append(dep)
 
@@ -1396,83 +1792,51 @@ class PremakeGenerator:
             if executable_external_deps:
                 external_deps = executable_external_deps
 
-            # Process special_flags for frameworks
-            special_flags_frameworks = []
-            special_flags = lib.get('special_flags', '')
-            if special_flags:
-                # Parse special_flags to extract frameworks
-                flag_parts = special_flags.split()
-                i = 0
-                while i < len(flag_parts):
-                    if flag_parts[i] == '-framework' and i + 1 < len(flag_parts):
-                        framework_name = flag_parts[i + 1]
-                        special_flags_frameworks.append(framework_name)
-                        i += 2
-                    else:
-                        i += 1
-
-            # Add libdirs if we have dependencies
-            self.premake_content.extend([
-                '    libdirs {',
-            ])
+            # Frameworks named in special_flags ("-framework X")
+            special_flags_frameworks = _framework_names(_split_flags(lib.get('special_flags', '')))
 
-            # Add platform-specific library paths
+            # Add libdirs if we have dependencies, with platform-specific library paths
             if link_type == 'executable':
                 # Final executables add configured external directories below.
                 # Do not put /usr/local ahead of them: on Apple Silicon it can
                 # select an x86_64 dylib instead of the configured ARM archive.
-                self.premake_content.append('        "build/lib",')
+                lines.extend(_EXECUTABLE_LIBDIRS_BLOCK)
             elif self.use_windows_config:
-                self.premake_content.extend([
-                    '        "/clang64/lib",',
-                    '        "win-native-deps/lib",',
-                    '        "build/lib",',
-                ])
+                lines.extend(_WINDOWS_PROJECT_LIBDIRS_BLOCK)
             else:
-                self.premake_content.extend([
-                    '        "/opt/homebrew/lib",',
-                    '        "/usr/local/lib",',
-                    '        "build/lib",',
-                ])
-
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+                lines.extend(_PROJECT_LIBDIRS_BLOCK)
 
             # Add linkoptions for external static libraries
             if external_deps:
                 static_libs = []
                 frameworks = []
                 dynamic_libs = []
+                target_overrides = self._external_overrides_for_target(lib)
                 for dep in external_deps:
-                    if dep in self.external_libraries:
-                        lib_info = self._external_library_for_target(lib, dep)
-
-                        # Skip libraries with link type "none"
-                        if lib_info.get('link') == 'none':
-                            continue
-
-                        lib_path = lib_info['lib']
-
-                        if lib_info.get('link') == 'dynamic':
-                            if lib_path.startswith('-framework '):
-                                frameworks.append(lib_path.replace('-framework ', ''))
-                            elif lib_path.startswith('-l'):
-                                dynamic_libs.append(lib_path.replace('-l', ''))
-                            else:
-                                dynamic_libs.append(lib_path)
-                        else:
-                            # Premake rewrites links relative to build/premake.
-                            # Executable links must retain the config-relative
-                            # path so its generated -L directory lands at the
-                            # repository root; archive linkoptions retain the
-                            # historical spelling for compatibility.
-                            if (link_type != 'executable' and
-                                    not lib_path.startswith('/') and
-                                    not lib_path.startswith('-l')):
-                                lib_path = f"../../{lib_path}"
-                            static_libs.append(lib_path)
+                    if dep not in self.external_libraries:
+                        continue
+                    override = target_overrides.get(dep)
+                    if override:
+                        kind, value = _classify_external_library(
+                            {**self.external_libraries[dep], **override})
+                    else:
+                        kind, value = self._external_link_kinds[dep]
+
+                    if kind == 'framework':
+                        frameworks.append(value)
+                    elif kind == 'dynamic':
+                        dynamic_libs.append(value)
+                    elif kind == 'static':
+                        # Premake rewrites links relative to build/premake.
+                        # Executable links must retain the config-relative
+                        # path so its generated -L directory lands at the
+                        # repository root; archive linkoptions retain the
+                        # historical spelling for compatibility.
+                        if (link_type != 'executable' and
+                                not value.startswith(('/', '-l'))):
+                            value = f"../../{value}"
+                        static_libs.append(value)
+                    # link type "none" is skipped
 
                 # Static libraries on a final executable must be emitted in
                 # links, after internal archive dependencies. Premake places
@@ -1484,17 +1848,14 @@ class PremakeGenerator:
                         # -l name: ld otherwise prefers a same-named dylib,
                         # leaving lambda-static with accidental local runtime
                         # dependencies and incompatible provider ABIs.
-                        self.premake_content.append('    linkoptions {')
+                        lines.append('    linkoptions {')
                         for static_lib in static_libs:
                             mac_static_lib = static_lib
                             if not mac_static_lib.startswith('/'):
                                 mac_static_lib = f'../../{mac_static_lib}'
-                            self.premake_content.append(
+                            lines.append(
                                 f'        "-Wl,-force_load,{mac_static_lib}",')
-                        self.premake_content.extend([
-                            '    }',
-                            '    '
-                        ])
+                        lines.extend(_CLOSE_BLOCK)
                     elif link_type == 'executable':
                         static_link_dirs = []
                         static_link_names = []
@@ -1514,7 +1875,7 @@ class PremakeGenerator:
                             static_link_names.append(
                                 name if self.use_macos_config else f'{name}:static')
                         if static_link_dirs:
-                            self.premake_content.append('    libdirs {')
+                            lines.append('    libdirs {')
                             # Project-local archives must win over package-manager
                             # directories: Homebrew can provide ABI-incompatible
                             # RE2/ThorVG variants with the same -l names.
@@ -1522,90 +1883,56 @@ class PremakeGenerator:
                                 static_link_dirs,
                                 key=lambda directory: directory.startswith('/opt/') or
                                 directory.startswith('/usr/'))
-                            for directory in ordered_static_dirs:
-                                self.premake_content.append(f'        "{directory}",')
-                            self.premake_content.extend([
-                                '    }',
-                                '    '
-                            ])
+                            lines.extend(_quoted_lines(ordered_static_dirs))
+                            lines.extend(_CLOSE_BLOCK)
                     else:
-                        self.premake_content.append('    linkoptions {')
-                        for lib_path in static_libs:
-                            self.premake_content.append(f'        "{lib_path}",')
+                        lines.append('    linkoptions {')
+                        lines.extend(_quoted_lines(static_libs))
                         # Add Windows system libraries that static libraries depend on
                         if self.use_windows_config:
                             # Windows networking libraries for CURL
-                            self.premake_content.extend([
-                                '        "-lws2_32",',
-                                '        "-lwsock32",',
-                                '        "-lwinmm",',
-                                '        "-lcrypt32",',
-                                '        "-lbcrypt",',
-                                '        "-ladvapi32",',
-                            ])
-                        # Add Windows DLL export flags for lambda-data projects
-                        if (self.use_windows_config and link_type == 'dynamic' and project_name.startswith('lambda-data')):
-                            self.premake_content.extend([
-                                '        "-Wl,--export-all-symbols",',
-                                '        "-Wl,--enable-auto-import",',
-                            ])
-                        self.premake_content.extend([
-                            '    }',
-                            '    '
-                        ])
+                            lines.extend(self._WINDOWS_NETWORK_LIB_LINES)
+                        # The lambda-data-cpp DLL exports everything alongside its
+                        # .def file; the C project gets the same flags once,
+                        # from the DLL export block below
+                        if (self.use_windows_config and link_type == 'dynamic' and project_name == 'lambda-data-cpp'):
+                            lines.extend(_DLL_EXPORT_ALL_LINES)
+                        lines.extend(_CLOSE_BLOCK)
 
                 # Add frameworks, dynamic libraries, and internal libraries to links
                 if frameworks or dynamic_libs or internal_deps or special_flags_frameworks or \
                         (link_type == 'executable' and static_libs and not self.use_macos_config):
-                    self.premake_content.append('    links {')
+                    lines.append('    links {')
                     # Add frameworks from external dependencies (macOS only)
                     if not self.use_windows_config:
                         for framework in frameworks:
-                            self.premake_content.append(f'        "{framework}.framework",')
+                            lines.append(f'        "{framework}.framework",')
                     # Add frameworks from special_flags (macOS only)
                     if not self.use_windows_config:
                         for framework in special_flags_frameworks:
-                            self.premake_content.append(f'        "{framework}.framework",')
-                    for dyn_lib in dynamic_libs:
-                        self.premake_content.append(f'        "{dyn_lib}",')
+                            lines.append(f'        "{framework}.framework",')
+                    lines.extend(_quoted_lines(dynamic_libs))
                     if not (self.use_linux_config and link_type == 'executable'):
-                        for dep in internal_deps:
-                            self.premake_content.append(f'        "{dep}",')
+                        lines.extend(_quoted_lines(internal_deps))
                     if link_type == 'executable' and not self.use_macos_config:
-                        for static_link_name in static_link_names:
-                            self.premake_content.append(f'        "{static_link_name}",')
-                    self.premake_content.extend([
-                        '    }',
-                        '    '
-                    ])
+                        lines.extend(_quoted_lines(static_link_names))
+                    lines.extend(_CLOSE_BLOCK)
             else:
                 # Add links for internal libraries and special_flags frameworks only
                 if internal_deps or special_flags_frameworks:
-                    self.premake_content.append('    links {')
+                    lines.append('    links {')
                     # Add frameworks from special_flags (macOS only)
                     if not self.use_windows_config:
                         for framework in special_flags_frameworks:
-                            self.premake_content.append(f'        "{framework}.framework",')
-                    for dep in internal_deps:
-                        self.premake_content.append(f'        "{dep}",')
-                    self.premake_content.extend([
-                        '    }',
-                        '    '
-                    ])
+                            lines.append(f'        "{framework}.framework",')
+                    lines.extend(_quoted_lines(internal_deps))
+                    lines.extend(_CLOSE_BLOCK)
 
             if self.use_linux_config and link_type == 'executable' and internal_deps:
                 # Internal archives are linked through the explicit GNU group
                 # below; retain project ordering so Premake still builds them
                 # before the executable.
-                self.premake_content.extend([
-                    '    dependson {',
-                ])
-                for dep in internal_deps:
-                    self.premake_content.append(f'        "{dep}",')
-                self.premake_content.extend([
-                    '    }',
-                    '    '
-                ])
+                lines.extend(_list_block('dependson', internal_deps))
 
             if self.use_linux_config and link_type == 'executable':
                 # GNU ld scans an archive once unless it is in a group. Lambda's
@@ -1623,36 +1950,27 @@ class PremakeGenerator:
                     # when they are supplied as separate linkoptions.
                     group_option = '-Wl,--start-group,' + ','.join(
                         linux_group_archives) + ',--end-group'
-                    self.premake_content.extend([
+                    lines.extend([
                         '    linkoptions {',
                         f'        "{group_option}",',
                     ])
-                    self.premake_content.extend([
-                        '    }',
-                        '    '
-                    ])
+                    lines.extend(_CLOSE_BLOCK)
 
         # Add Windows DLL export flags for lambda-data projects as separate linkoptions
         if (self.use_windows_config and link_type == 'dynamic' and
             project_name.startswith('lambda-data')):
             if project_name == 'lambda-data-cpp':
                 # Use .def file for C++ project for precise symbol export
-                self.premake_content.extend([
+                lines.extend([
                     '    linkoptions {',
                     '        "-Wl,--output-def,lambda-data-cpp.def",',
                     '        "../../lambda-data-cpp.def",',
                     '    }',
-                    '    '
+                    ''
                 ])
             else:
                 # Use export-all-symbols for C project
-                self.premake_content.extend([
-                    '    linkoptions {',
-                    '        "-Wl,--export-all-symbols",',
-                    '        "-Wl,--enable-auto-import",',
-                    '    }',
-                    '    '
-                ])
+                lines.extend(_DLL_EXPORT_ALL_BLOCK)
 
         # A hosted native module intentionally resolves its host services when
         # the trusted host loads it. Platform linkers use different spellings
@@ -1662,13 +1980,7 @@ class PremakeGenerator:
             ('link_options_macos' if self.use_macos_config else 'link_options_linux')
         link_options = link_options + lib.get(platform_key, [])
         if link_options:
-            self.premake_content.append('    linkoptions {')
-            for option in link_options:
-                self.premake_content.append(f'        "{option}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('linkoptions', link_options))
 
         # Add platform-specific defines
         platform_defines = []
@@ -1695,48 +2007,36 @@ class PremakeGenerator:
         all_defines = platform_defines + target_defines
 
         if all_defines:
-            self.premake_content.extend([
-                '    defines {',
-            ])
-            for define in all_defines:
-                self.premake_content.append(f'        "{define}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('defines', all_defines))
 
         # Add macOS frameworks for library projects
         if self.use_macos_config:
-            self.premake_content.extend([
+            lines.extend([
                 '    -- Add macOS frameworks',
                 '    linkoptions {'
             ])
 
             # Add macOS frameworks using linkoptions
-            for lib_name in self.external_libraries:
-                if self.external_libraries[lib_name].get('link') == 'dynamic':
-                    lib_flag = self.external_libraries[lib_name]['lib']
-                    if lib_flag.startswith('-framework '):
-                        self.premake_content.append(f'        "{lib_flag}",')
+            for lib_name, (kind, _) in self._external_link_kinds.items():
+                if kind == 'framework':
+                    lines.append(f'        "{self.external_libraries[lib_name]["lib"]}",')
 
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_CLOSE_BLOCK)
 
         # Automatically add C++ standard library for C++ library projects
         if needs_cpp_stdlib and not self.use_windows_config:
             # Add C++ standard library based on platform
             cpp_stdlib = 'c++' if self.use_macos_config else 'stdc++'
-            self.premake_content.extend([
+            lines.extend([
                 '    -- Automatically added C++ standard library',
                 '    links {',
                 f'        "{cpp_stdlib}",',
                 '    }',
-                '    '
+                ''
             ])
 
-        self.premake_content.append('')
+        lines.append('')
+        self._emit(lines)
 
     def _create_wrapper_project(self, lib_name: str, sub_projects: List[str], lib: Dict[str, Any] = None) -> None:
         """Create a wrapper project that combines multiple sub-projects"""
@@ -1749,27 +2049,8 @@ class PremakeGenerator:
 
         kind = "SharedLib" if link_type == 'dynamic' else "StaticLib"
 
-        self.premake_content.extend([
-            f'project "{lib_name}"',
-            f'    kind "{kind}"',
-            '    language "C++"',
-            '    targetdir "build/lib"',
-            '    objdir "build/obj/%{prj.name}"',
-            '    ',
-            '    -- Wrapper library with empty source file',
-            '    files {',
-            '        "utils/empty.cpp",',
-            '    }',
-            '    ',
-            '    links {',
-        ])
-        for source in sub_projects:
-            self.premake_content.append(f'        "{source}",')
-        self.premake_content.extend([
-            '    }',
-            '    '
-        ])
-        self.premake_content.append('')
+        links = ''.join(f'\n        "{source}",' for source in sub_projects)
+        self._emit(_WRAPPER_PROJECT_TEMPLATE.format(name=lib_name, kind=kind, links=links))
 
     def _generate_meta_library(self, lib: Dict[str, Any]) -> None:
         """Generate a meta-library that combines other libraries"""
@@ -1781,35 +2062,25 @@ class PremakeGenerator:
         link_type = lib.get('link', 'static')
         kind = "SharedLib" if link_type == 'dynamic' else "StaticLib"
 
-        self.premake_content.extend([
-            f'project "{lib_name}"',
-            f'    kind "{kind}"',
-            '    language "C"',
-            '    targetdir "build/lib"',
-            '    objdir "build/obj/%{prj.name}"',
-            '    ',
+        lines = [
+            _PROJECT_HEADER_TEMPLATE.format(name=lib_name, kind=kind, language='C', target_dir='build/lib'),
+            '',
             '    -- Meta-library: combines source files from dependencies',
             '    files {',
-        ])
+        ]
 
         # Add sources directly specified in the library
-        for source in sources:
-            self.premake_content.append(f'        "{source}",')
+        lines.extend(_quoted_lines(sources))
 
         # Add source files from dependent inline libraries
-        inline_libs = ['strbuf', 'strview', 'mem-pool', 'datetime', 'string', 'num_stack', 'url']
         for dep in dependencies:
-            if dep in inline_libs:
+            if dep in self._INLINE_LIBS:
                 # Find the actual library definition to get its sources
-                for config_lib in self.config.get('libraries', []):
-                    if config_lib.get('name') == dep and 'sources' in config_lib:
-                        for source in config_lib['sources']:
-                            self.premake_content.append(f'        "{source}",')
+                config_lib = self._libraries_by_name.get(dep)
+                if config_lib and 'sources' in config_lib:
+                    lines.extend(_quoted_lines(config_lib['sources']))
 
-        self.premake_content.extend([
-            '    }',
-            '    ',
-        ])
+        lines.extend(_CLOSE_BLOCK)
 
         # Add include directories - start with consolidated includes
         all_includes = []
@@ -1822,8 +2093,7 @@ class PremakeGenerator:
         all_includes.append("lib/mem-pool/include")
 
         # Add external library include paths for meta-library dependencies
-        inline_libs = ['strbuf', 'strview', 'mem-pool', 'datetime', 'string', 'num_stack', 'url']
-        external_deps = [dep for dep in dependencies if dep not in inline_libs]
+        external_deps = [dep for dep in dependencies if dep not in self._INLINE_LIBS]
         for lib_name in external_deps:
             if lib_name in self.external_libraries:
                 include_path = self.external_libraries[lib_name]['include']
@@ -1831,48 +2101,30 @@ class PremakeGenerator:
                     all_includes.append(include_path)
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_includes = []
-        for include in all_includes:
-            if include and include not in seen:
-                unique_includes.append(include)
-                seen.add(include)
+        unique_includes = _dedup_preserve_order(all_includes)
 
         if unique_includes:
-            self.premake_content.extend([
-                '    includedirs {',
-            ])
-            for include_path in unique_includes:
-                self.premake_content.append(f'        "{include_path}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('includedirs', unique_includes))
 
         # Add library dependencies for meta-libraries
         if dependencies:
-            external_deps = [dep for dep in dependencies if dep not in inline_libs]
+            external_deps = [dep for dep in dependencies if dep not in self._INLINE_LIBS]
             if external_deps:
-                self.premake_content.extend([
-                    '    libdirs {',
-                ])
+                lines.append('    libdirs {')
 
                 # Add platform-specific library paths
                 if self.use_windows_config:
-                    self.premake_content.extend([
+                    lines.extend([
                         '        "/clang64/lib",',
                         '        "win-native-deps/lib",',
                     ])
                 else:
-                    self.premake_content.extend([
+                    lines.extend([
                         '        "/opt/homebrew/lib",',
                         '        "/usr/local/lib",',
                     ])
 
-                self.premake_content.extend([
-                    '    }',
-                    '    ',
-                ])
+                lines.extend(_CLOSE_BLOCK)
 
                 # For SharedLib (link: dynamic) we must resolve external symbols
                 # at link time — that means feeding the actual .a/.dylib paths to
@@ -1883,68 +2135,39 @@ class PremakeGenerator:
                 # to the final exe link, where lambda-data or the test
                 # entry provides the resolved paths.
                 if link_type == 'dynamic':
-                    self.premake_content.append('    linkoptions {')
+                    lines.append('    linkoptions {')
                     for dep in external_deps:
                         if dep in self.external_libraries:
-                            lib_path = self.external_libraries[dep].get('lib', '')
-                            if lib_path:
-                                # Premake gmake files live in build/premake/,
-                                # so prefix relative paths to climb back to repo root.
-                                if not lib_path.startswith('/'):
-                                    lib_path = f'../../{lib_path}'
-                                self.premake_content.append(f'        "{lib_path}",')
+                            if self.external_libraries[dep].get('lib', ''):
+                                lines.append(f'        "{self._build_lib_paths[dep]}",')
                             else:
                                 # External lib has no `lib` field (e.g. system
                                 # framework). Fall back to -l form.
-                                self.premake_content.append(f'        "-l{dep}",')
+                                lines.append(f'        "-l{dep}",')
                         else:
-                            self.premake_content.append(f'        "-l{dep}",')
-                    self.premake_content.extend([
-                        '    }',
-                        '    '
-                    ])
+                            lines.append(f'        "-l{dep}",')
+                    lines.extend(_CLOSE_BLOCK)
                 else:
-                    self.premake_content.append('    links {')
-                    for dep in external_deps:
-                        self.premake_content.append(f'        "{dep}",')
-                    self.premake_content.extend([
-                        '    }',
-                        '    '
-                    ])
+                    lines.extend(_list_block('links', external_deps))
 
         # Get compiler-specific build options
-        base_compiler, _ = self._get_compiler_info()
-        build_opts = self._get_build_options(base_compiler)
+        build_opts = self._get_build_options()
         if lib.get('pic') and '-fPIC' not in build_opts:
             build_opts.append('-fPIC')
 
         # Filter out C++ standard flags since this is a C-only meta-library
         build_opts = [opt for opt in build_opts if not opt.startswith('-std=c++')]
 
-        self.premake_content.extend([
-            '    buildoptions {',
-        ])
+        lines.append('    buildoptions {')
 
-        for opt in build_opts:
-            self.premake_content.append(f'        "{opt}",')
+        lines.extend(_quoted_lines(build_opts))
 
-        self.premake_content.extend([
-            '    }',
-            '    '
-        ])
+        lines.extend(_CLOSE_BLOCK)
 
         # Add defines from target configuration
         target_defines = lib.get('defines', [])
         if target_defines:
-            self.premake_content.extend([
-                '    defines {',
-            ])
-            for define in target_defines:
-                self.premake_content.append(f'        "{define}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('defines', target_defines))
 
         # Add Windows DLL export flags for lambda-data projects as separate linkoptions
         if (self.use_windows_config and lib.get('link') == 'dynamic' and
@@ -1974,23 +2197,20 @@ class PremakeGenerator:
                     '        "-Wl,--output-def,lambda-data-cpp.def",',
                     '        "../../lambda-data-cpp.def",',
                     '    }',
-                    '    '
+                    ''
                 ]
-                self.premake_content.extend(link_opts)
+                lines.extend(link_opts)
             else:
                 # Use export-all-symbols for C project
                 link_opts = ['    linkoptions {']
                 link_opts.extend(f'        "{dep}",' for dep in curl_static_deps)
-                link_opts += [
-                    '        "-Wl,--export-all-symbols",',
-                    '        "-Wl,--enable-auto-import",',
-                    '    }',
-                    '    '
-                ]
-                self.premake_content.extend(link_opts)
+                link_opts.extend(_DLL_EXPORT_ALL_LINES)
+                link_opts.extend(_CLOSE_BLOCK)
+                lines.extend(link_opts)
 
 
-        self.premake_content.append('')
+        lines.append('')
+        self._emit(lines)
 
     def generate_test_projects(self) -> None:
         """Generate test executable projects from test suites or test_projects"""
@@ -2046,23 +2266,19 @@ class PremakeGenerator:
         if not name or not files:
             return
 
-        self.premake_content.extend([
+        lines = [
             '',
-            f'project "{name}"',
-            f'    kind "{kind}"',
-            f'    language "{language}"',
-            f'    targetdir "{self.config.get("target_dir", "test")}"',
-            f'    objdir "build/obj/%{{prj.name}}"',
-            f'    targetextension ".exe"',
+            _PROJECT_HEADER_TEMPLATE.format(name=name, kind=kind, language=language,
+                                            target_dir=self.config.get("target_dir", "test")),
+            '    targetextension ".exe"',
             '',
             f'    files {{',
-        ])
+        ]
 
         # Add source files
-        for file in files:
-            self.premake_content.append(f'        "{file}",')
+        lines.extend(_quoted_lines(files))
 
-        self.premake_content.extend([
+        lines.extend([
             '    }',
             '',
         ])
@@ -2079,44 +2295,34 @@ class PremakeGenerator:
         all_includes.extend(include_dirs)
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_includes = []
-        for include in all_includes:
-            if include and include not in seen:
-                unique_includes.append(include)
-                seen.add(include)
+        unique_includes = _dedup_preserve_order(all_includes)
 
         if unique_includes:
-            self.premake_content.append('    includedirs {')
-            for include_dir in unique_includes:
-                self.premake_content.append(f'        "{include_dir}",')
-            self.premake_content.extend([
+            lines.append('    includedirs {')
+            lines.extend(_quoted_lines(unique_includes))
+            lines.extend([
                 '    }',
                 '',
             ])
 
-        self.premake_content.extend([
-            '    libdirs {'
-        ])
+        lines.append('    libdirs {')
 
         # Add library directories
-        for lib_dir in self.config.get('lib_dirs', []):
-            self.premake_content.append(f'        "{lib_dir}",')
+        lines.extend(_quoted_lines(self.config.get('lib_dirs', [])))
 
-        self.premake_content.extend([
+        lines.extend([
             '    }',
             '',
             '    links {'
         ])
 
         # Add linked libraries
-        for link in links:
-            self.premake_content.append(f'        "{link}",')
+        lines.extend(_quoted_lines(links))
 
-        for lib in self.config.get('libraries', []):
-            self.premake_content.append(f'        "{lib}",')
+        # Entries of the 'libraries' list may be dicts; format them as before
+        lines.extend(_quoted_lines(map(str, self.config.get('libraries', []))))
 
-        self.premake_content.extend([
+        lines.extend([
             '    }',
             '',
         ])
@@ -2126,25 +2332,23 @@ class PremakeGenerator:
         cxxflags = self.config.get('cxxflags', [])
 
         if cflags:
-            self.premake_content.extend([
+            lines.extend([
                 '    filter "files:**.c"',
                 '        buildoptions {'
             ])
-            for flag in cflags:
-                self.premake_content.append(f'            "{flag}",')
-            self.premake_content.extend([
+            lines.extend(_quoted_lines(cflags, indent=12))
+            lines.extend([
                 '        }',
                 ''
             ])
 
         if cxxflags:
-            self.premake_content.extend([
+            lines.extend([
                 '    filter "files:**.cpp"',
                 '        buildoptions {'
             ])
-            for flag in cxxflags:
-                self.premake_content.append(f'            "{flag}",')
-            self.premake_content.extend([
+            lines.extend(_quoted_lines(cxxflags, indent=12))
+            lines.extend([
                 '        }',
                 ''
             ])
@@ -2152,12 +2356,9 @@ class PremakeGenerator:
         # Add defines
         defines = self.config.get('defines', [])
         if defines:
-            self.premake_content.extend([
-                '    defines {'
-            ])
-            for define in defines:
-                self.premake_content.append(f'        "{define}",')
-            self.premake_content.extend([
+            lines.append('    defines {')
+            lines.extend(_quoted_lines(defines))
+            lines.extend([
                 '    }',
                 ''
             ])
@@ -2165,7 +2366,7 @@ class PremakeGenerator:
         # Add platform-specific settings
         platform = self.config.get('platform', '')
         if platform == 'Linux_x64':
-            self.premake_content.extend([
+            lines.extend([
                 f'    filter "platforms:{platform}"',
                 '        system "linux"',
                 '        architecture "x64"',
@@ -2174,15 +2375,17 @@ class PremakeGenerator:
                 ''
             ])
 
-        self.premake_content.extend([
+        lines.extend([
             '    filter {}',
             ''
         ])
+        self._emit(lines)
 
     def _generate_test_suite(self, suite: Dict[str, Any]) -> None:
         """Generate test projects for a specific test suite"""
         suite_name = suite.get('suite', '')
-        special_flags = suite.get('special_flags', '')
+        # Split once per suite; tests without their own flags share the list
+        special_flags = _split_flags(suite.get('special_flags', ''))
         cpp_flags = suite.get('cpp_flags', '')
 
         # Handle both old and new configuration formats
@@ -2212,7 +2415,8 @@ class PremakeGenerator:
                         libraries.append('gtest_main')
 
                 # Enhanced support for test-specific flags and additional sources
-                test_special_flags = test.get('special_flags', special_flags)  # Test-specific flags override suite flags
+                # Test-specific flags override suite flags
+                test_special_flags = _split_flags(test['special_flags']) if 'special_flags' in test else special_flags
                 additional_sources = test.get('additional_sources', [])  # New field for extra source files
 
                 # Apply platform-specific overrides for tests
@@ -2252,34 +2456,31 @@ class PremakeGenerator:
                     continue
 
                 # Avoid subdirectory structure by flattening test names
-                # Extract just the filename from binary path to prevent double prefixes
-                import os
-                binary_basename = os.path.basename(binary_name)
-                test_name = binary_basename.replace('/', '_')
-                if test_name.startswith('test_'):
-                    test_name = test_name[5:]  # Remove 'test_' prefix only
-                test_name = f"test_{test_name}"
+                # Extract just the filename from binary path to prevent double
+                # prefixes; a basename has no '/', so only 'test_' is normalized
+                test_name = 'test_' + os.path.basename(binary_name).removeprefix('test_')
                 additional_files = test.get('additional_files', [])
 
                 # Determine correct file path - use relative paths from project root
-                if source.startswith("test/"):
-                    test_file_path = source
-                else:
-                    test_file_path = f"test/{source}"
+                test_file_path = source if source.startswith("test/") else f"test/{source}"
 
-                # Ensure path exists before adding to project
-                actual_path = source if source.startswith("test/") else f"test/{source}"
-                full_path = os.path.join(os.getcwd(), actual_path)
-                if not os.path.exists(full_path):
-                    elog(f"Warning: Test file not found: {actual_path}")
+                # Ensure the source exists before adding it to the project; the
+                # path is relative to the repository root, which is the cwd.
+                if not self._test_file_exists(test_file_path):
+                    elog(f"Warning: Test file not found: {test_file_path}")
                     continue
 
                 test_disable_sanitizer = test.get('disable_sanitizer', False)
-                self._generate_single_test(test_name, test_file_path, dependencies, test_special_flags, cpp_flags, libraries, defines, additional_files, additional_sources, binary_name, test_disable_sanitizer)
+                # Written as soon as it is rendered
+                self._emit(self._generate_single_test(test_name, test_file_path, dependencies, test_special_flags, cpp_flags, libraries, defines, additional_files, additional_sources, binary_name, test_disable_sanitizer))
 
     def _generate_single_test(self, test_name: str, test_file_path: str, dependencies: List[str],
-                             special_flags: str, cpp_flags: str, libraries: List[str] = None, defines: List[str] = None, additional_files: List[str] = None, additional_sources: List[str] = None, target_name: str = None, disable_sanitizer_override: bool = False) -> None:
-        """Generate a single test project"""
+                             special_flags: List[str], cpp_flags: str, libraries: List[str] = None, defines: List[str] = None, additional_files: List[str] = None, additional_sources: List[str] = None, target_name: str = None, disable_sanitizer_override: bool = False) -> List[str]:
+        """Generate a single test project
+
+        Returns the project's lines instead of writing them, so a test depends
+        only on its own arguments and the read-only generator state.
+        """
         if libraries is None:
             libraries = []
         if defines is None:
@@ -2291,103 +2492,34 @@ class PremakeGenerator:
 
         source = test_file_path
         language = "C" if source.endswith('.c') else "C++"
+        test_name_lower = test_name.lower()
 
-        self.premake_content.extend([
-            f'project "{test_name}"',
-            '    kind "ConsoleApp"',
-            f'    language "{language}"',
-            '    targetdir "test"',
-            '    objdir "build/obj/%{prj.name}"',
-        ])
+        lines = [_PROJECT_HEADER_TEMPLATE.format(
+            name=test_name, kind='ConsoleApp', language=language, target_dir='test')]
 
         # Use custom target name if provided, otherwise use the project name
         if target_name:
             # Remove .exe extension and extract just the filename for targetname
-            import os
             clean_target_name = os.path.basename(target_name).replace('.exe', '')
-            self.premake_content.append(f'    targetname "{clean_target_name}"')
+            lines.append(f'    targetname "{clean_target_name}"')
 
-        self.premake_content.extend([
+        lines.extend([
             '    targetextension ".exe"',
-            '    ',
+            '',
             '    files {',
             f'        "{test_file_path}",',
         ])
 
         # Add additional source files if specified (NEW FEATURE)
-        for additional_source in additional_sources:
-            self.premake_content.append(f'        "{additional_source}",')
+        lines.extend(_quoted_lines(additional_sources))
 
         # Add additional files if specified
-        for additional_file in additional_files:
-            self.premake_content.append(f'        "{additional_file}",')
-
-        self.premake_content.extend([
-            '    }',
-            '    '
-        ])
-
-        # Add include directories using consolidated includes and parsed library definitions
-        all_includes = []
-
-        # Add consolidated global and platform-specific includes first
-        consolidated_includes = self._get_consolidated_includes()
-        all_includes.extend(consolidated_includes)
-
-        # Add default mem-pool include for tests
-        all_includes.append("lib/mem-pool/include")
-
-        # Add external library include paths from parsed definitions
-        for lib_name, lib_info in self.external_libraries.items():
-            # Skip libraries with link type "none"
-            if lib_info.get('link') == 'none':
-                continue
-
-            if lib_info['include']:
-                all_includes.append(lib_info['include'])
-
-        # Add platform-specific include paths
-        platform = self.config.get('platform', 'macOS')
-        if platform == 'Linux_x64':
-            # Linux cross-compilation paths
-            all_includes.extend([
-                "linux-deps/include",
-                "linux-deps/include/ncurses",
-            ])
-        elif self.use_windows_config:
-            # Windows/MSYS2 paths
-            all_includes.extend([
-                "/clang64/include",
-                "win-native-deps/include",
-            ])
-        else:
-            # macOS paths (default)
-            # IMPORTANT: /opt/homebrew/include must come before /usr/local/include
-            # to ensure Homebrew's gtest headers are found before any system-wide
-            # gtest installation that may have incompatible declarations
-            all_includes.extend([
-                "/opt/homebrew/include",
-                "/usr/local/include",
-            ])
+        lines.extend(_quoted_lines(additional_files))
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_includes = []
-        for include in all_includes:
-            if include and include not in seen:
-                unique_includes.append(include)
-                seen.add(include)
+        lines.extend(_CLOSE_BLOCK)
 
-        if unique_includes:
-            self.premake_content.extend([
-                '    includedirs {',
-            ])
-            for include_path in unique_includes:
-                self.premake_content.append(f'        "{include_path}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+        # Add include directories (shared by every test, built once)
+        lines.extend(self._test_includedir_lines)
 
         # Add defines if specified
         project_defines = list(defines)
@@ -2398,52 +2530,12 @@ class PremakeGenerator:
                 if define not in project_defines:
                     project_defines.append(define)
         if project_defines:
-            self.premake_content.append('    defines {')
-            for define in project_defines:
-                self.premake_content.append(f'        "{define}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('defines', project_defines))
 
         # Add library paths
-        self.premake_content.append('    libdirs {')
-
-        # Add platform-specific library paths
-        platform = self.config.get('platform', 'macOS')
-        if platform == 'Linux_x64':
-            # Linux cross-compilation paths
-            self.premake_content.extend([
-                '        "linux-deps/lib",',
-                '        "build/lib",',
-            ])
-        elif self.use_linux_config:
-            # Native Linux paths
-            self.premake_content.extend([
-                '        "/usr/local/lib",',
-                '        "/usr/local/lib/aarch64-linux-gnu",',
-                '        "/usr/lib/aarch64-linux-gnu",',
-                '        "build/lib",',
-            ])
-        elif self.use_windows_config:
-            # Windows/MSYS2 paths
-            self.premake_content.extend([
-                '        "/clang64/lib",',
-                '        "win-native-deps/lib",',
-                '        "build/lib",',
-            ])
-        else:
-            # macOS paths (default)
-            self.premake_content.extend([
-                '        "/opt/homebrew/lib",',
-                '        "/usr/local/lib",',
-                '        "build/lib",',
-            ])
-
-        self.premake_content.extend([
-            '    }',
-            '    '
-        ])
+        lines.append('    libdirs {')
+        lines.extend(self._test_libdir_lines)
+        lines.extend(_CLOSE_BLOCK)
 
         # Static archives do not propagate transitive link requirements.  Walk the
         # full module closure here; copying only the direct target libraries leaves
@@ -2456,24 +2548,23 @@ class PremakeGenerator:
             for host_dependency in ('lambda-rt', 'radiant'):
                 if host_dependency not in dependencies:
                     dependencies.append(host_dependency)
-        configured_targets = {
-            target.get('name'): target for target in self.config.get('targets', [])
-            if target.get('name')
-        }
+        configured_targets = self._targets_by_name
         dependency_root = {'libraries': dependencies}
         for target_library in self._executable_external_dependencies(dependency_root):
             if target_library not in libraries:
                 libraries.append(target_library)
 
-        # Add library dependencies
-        self.premake_content.append('    links {')
+        # Add library dependencies. Entries are gathered first so a library
+        # reached through both the dependencies and the libraries list (e.g.
+        # criterion) is only passed to the linker once.
+        link_tokens = []
         internal_project_links = []
 
         def add_internal_project_link(project_name: str) -> None:
             if project_name in internal_project_links:
                 return
             if not self.use_linux_config:
-                self.premake_content.append(f'        "{project_name}",')
+                link_tokens.append(project_name)
             internal_project_links.append(project_name)
 
         def internal_project_artifact(project_name: str) -> str:
@@ -2490,7 +2581,7 @@ class PremakeGenerator:
             return f'../lib/lib{project_name}{suffix}'
 
         # Initialize test frameworks tracking
-        test_frameworks_added = []
+        test_frameworks_added = set()
 
         # Process dependencies first
         if dependencies:
@@ -2500,43 +2591,18 @@ class PremakeGenerator:
                 dependencies,
                 key=lambda dep: 0 if configured_targets.get(dep, {}).get('link') == 'dynamic' else 1)
             for dep in dependency_order:
+                runtime_projects = self._RUNTIME_DEP_PROJECTS.get(dep)
                 if dep == 'criterion':
-                    self.premake_content.append('        "criterion",')
-                elif dep in ['lambda-runtime-full', 'lambda-data', 'lambda-rt']:
+                    link_tokens.append('criterion')
+                elif runtime_projects:
+                    for project_name in runtime_projects:
+                        add_internal_project_link(project_name)
                     # Special handling for MIR, Lambda, Math, and Markup tests
-                    if ('mir' in test_name.lower() or 'lambda' in test_name.lower() or 'math' in test_name.lower() or 'markup' in test_name.lower()) and dep == 'lambda-runtime-full':
-                        # All tests only need the -cpp versions (C++ project includes all C files)
-                        add_internal_project_link('lambda-runtime-full-cpp')
-                        add_internal_project_link('lambda-rt-cpp')
+                    if dep == 'lambda-runtime-full' and any(
+                            keyword in test_name_lower for keyword in ('mir', 'lambda', 'math', 'markup')):
                         add_internal_project_link('lambda-data-cpp')
-                    else:
-                        # Regular tests: only need -cpp version (C++ project includes all C files)
-                        add_internal_project_link(f'{dep}-cpp')
-                        if dep == 'lambda-runtime-full':
-                            # The validation DSO defers active runtime symbols
-                            # to its host; link the concrete runtime provider.
-                            add_internal_project_link('lambda-rt-cpp')
-                    if dep == 'lambda-data':
-                        # lambda-data consumes the lower general-purpose archive;
-                        # link its concrete mixed-language project for test executables.
-                        add_internal_project_link('lambda-lib-cpp')
-                    elif dep == 'lambda-rt':
-                        # A static wrapper archive contains no objects. Runtime
-                        # white-box tests must therefore link the concrete rt
-                        # archive and its lower concrete providers in archive
-                        # order; otherwise GC/side-stack symbols resolve but
-                        # their lib providers remain invisible to the linker.
-                        add_internal_project_link('lambda-data-cpp')
-                        add_internal_project_link('lambda-lib-cpp')
                 elif dep in configured_targets:
-                    target = configured_targets[dep]
-                    target_sources = target.get('source_files', []) or target.get('sources', [])
-                    target_patterns = target.get('source_patterns', [])
-                    has_cpp = any(path.endswith('.cpp') for path in target_sources) or any(
-                        '*.cpp' in pattern for pattern in target_patterns)
-                    has_c = any(path.endswith('.c') for path in target_sources) or any(
-                        '*.c' in pattern for pattern in target_patterns)
-                    project_name = f'{dep}-cpp' if has_cpp and has_c else dep
+                    project_name = f'{dep}-cpp' if dep in self._mixed_language_targets else dep
                     add_internal_project_link(project_name)
 
         # Add test framework libraries
@@ -2544,18 +2610,16 @@ class PremakeGenerator:
         if libraries:
             for lib in libraries:
                 if lib == 'criterion':
-                    self.premake_content.append('        "criterion",')
                     # Add Criterion dependencies (required on macOS with Homebrew)
-                    self.premake_content.append('        "nanomsg",')
-                    self.premake_content.append('        "git2",')
-                    test_frameworks_added.append('criterion')
+                    link_tokens.extend(('criterion', 'nanomsg', 'git2'))
+                    test_frameworks_added.add('criterion')
                 elif lib == 'gtest':
                     # Don't add to links - let static library handling in linkoptions handle it
                     # This avoids duplicate linking (-lgtest + /path/libgtest.a)
-                    test_frameworks_added.append('gtest')
+                    test_frameworks_added.add('gtest')
                 elif lib == 'gtest_main':
                     # Don't add to links - let static library handling in linkoptions handle it
-                    test_frameworks_added.append('gtest')
+                    test_frameworks_added.add('gtest')
                 else:
                     # Handle other libraries
                     if lib == 'c++fs':
@@ -2563,155 +2627,101 @@ class PremakeGenerator:
                         # Only add if not on macOS
                         platform = self.config.get('platform', 'macOS')
                         if platform != 'macOS' and 'darwin' not in platform.lower():
-                            self.premake_content.append('        "stdc++fs",')
+                            link_tokens.append('stdc++fs')
                         # On macOS, we don't need to link anything for filesystem
                     else:
                         # Check if this library is defined in external_libraries first
                         if lib in self.external_libraries:
                             lib_info = self.external_libraries[lib]
-                            # Skip libraries with link type "none"
-                            if lib_info.get('link') != 'none':
-                                # If it's a static library, it will be handled in linkoptions later
-                                # If it's dynamic, add it to links using the actual lib flag
-                                if lib_info.get('link') == 'dynamic':
-                                    lib_path = lib_info.get('lib', '')
-                                    if lib_path.startswith('-framework '):
-                                        pass  # frameworks handled via linkoptions below
-                                    elif lib_path.startswith('-l'):
-                                        # Use the actual flag name (strip -l) to avoid -l<name> mismatch
-                                        link_name = lib_path[2:]
-                                        self.premake_content.append(f'        "{link_name}",')
-                                    else:
-                                        self.premake_content.append(f'        "{lib}",')
-                                # Static libraries are handled in the linkoptions section below
+                            # Only dynamic libraries go into links, using the actual lib
+                            # flag; static ones are handled in linkoptions below and
+                            # link type "none" is skipped
+                            if lib_info['link'] == 'dynamic':
+                                lib_path = lib_info['lib']
+                                if lib_path.startswith('-framework '):
+                                    pass  # frameworks handled via linkoptions below
+                                elif lib_path.startswith('-l'):
+                                    # Use the actual flag name (strip -l) to avoid -l<name> mismatch
+                                    link_tokens.append(lib_path[2:])
+                                else:
+                                    link_tokens.append(lib)
                         else:
                             # Library not found in external definitions, assume it's a system library
-                            self.premake_content.append(f'        "{lib}",')
+                            link_tokens.append(lib)
 
             # Special handling for lambda tests that use Catch2
-            if (test_name and 'lambda' in test_name.lower() and 'catch2' in test_name.lower() and
-                libraries and any(lib in ['Catch2Main', 'Catch2', 'Catch2Maind', 'Catch2d'] for lib in libraries)):
+            if ('lambda' in test_name_lower and 'catch2' in test_name_lower and
+                libraries and not self._CATCH2_LIBS.isdisjoint(libraries)):
                 # Ensure catch2 is marked as added for lambda tests using Catch2
-                if 'catch2' not in test_frameworks_added:
-                    test_frameworks_added.append('catch2')
+                test_frameworks_added.add('catch2')
 
         # Only add criterion to test executables if no other test framework is specified
-        if 'criterion' not in test_frameworks_added and 'catch2' not in test_frameworks_added and 'gtest' not in test_frameworks_added:
-            self.premake_content.append('        "criterion",')
+        if not test_frameworks_added:
             # Add Criterion dependencies (required on macOS with Homebrew)
-            self.premake_content.append('        "nanomsg",')
-            self.premake_content.append('        "git2",')
-
-        # Close the links block
-        self.premake_content.extend([
-            '    }',
-            '    '
-        ])
+            link_tokens.extend(('criterion', 'nanomsg', 'git2'))
 
-        # Add external library linkoptions for test-specific libraries
-        if libraries:
-            external_static_libs = []
-            late_static_libs = []  # Static libs that need to come after internal libs (link order)
-            for lib_name in libraries:
-                if lib_name in self.external_libraries:
-                    lib_info = self.external_libraries[lib_name]
+        # Classify the test's external static libraries up front so late
+        # providers can close out the links block below.
+        external_static_libs = []
+        late_static_libs = []  # Static libs that need to come after internal libs (link order)
+        for lib_name in libraries:
+            if lib_name in self.external_libraries:
+                # Libraries with link type "none" or dynamic are not static providers
+                if self.external_libraries[lib_name]['link'] == 'static':
+                    lib_path = self._build_lib_paths[lib_name]
+
+                    # Special handling for tree-sitter libraries - add them to external_static_libs (linkoptions)
+                    if lib_name in self._TEST_LINKOPTION_LIBS:
+                        external_static_libs.append(lib_path)
+                    # On Linux/Windows, static libs need to come after internal libs in link order
+                    # because internal libraries can have unresolved symbols that these libs provide
+                    elif (self.use_linux_config or self.use_windows_config) and lib_name == 'utf8proc':
+                        late_static_libs.append((lib_name, lib_path))
+                    else:
+                        external_static_libs.append(lib_path)
 
-                    # Skip libraries with link type "none"
-                    if lib_info.get('link') == 'none':
-                        continue
+        # Add late static libraries at the end of the links block (must come after internal libs on Linux)
+        for lib_name, lib_path in late_static_libs:
+            if lib_name == 'utf8proc':
+                # Use :libutf8proc.a syntax (path in libdir /usr/lib/aarch64-linux-gnu)
+                link_tokens.append(':libutf8proc.a')
+            else:
+                link_tokens.append(lib_path)
 
-                    if lib_info.get('link') == 'static':
-                        lib_path = lib_info['lib']
-                        if not lib_path.startswith('/'):
-                            lib_path = f"../../{lib_path}"
-
-                        # Special handling for tree-sitter libraries - add them to external_static_libs (linkoptions)
-                        if lib_name in ['tree-sitter', 'tree-sitter-lambda', 'tree-sitter-latex-math']:
-                            external_static_libs.append(lib_path)
-                        # On Linux/Windows, static libs need to come after internal libs in link order
-                        # because internal libraries can have unresolved symbols that these libs provide
-                        elif (self.use_linux_config or self.use_windows_config) and lib_name == 'utf8proc':
-                            late_static_libs.append((lib_name, lib_path))
-                        else:
-                            external_static_libs.append(lib_path)
+        lines.extend(_list_block('links', _dedup_preserve_order(link_tokens)))
 
+        # Add external library linkoptions for test-specific libraries
+        if libraries:
             # Linux's GNU linker scans static archives once from left to right.
             # Keep external providers in the final LIBS sequence after Lambda's
             # archives; placing them in ALL_LDFLAGS makes image, MIR, and TLS
             # symbols invisible before their references have been seen.
-
-            # Add late static libraries to links block (must come after internal libs on Linux)
-            if late_static_libs:
-                # Re-open the links block
-                self.premake_content[-2] = '    '  # Remove the closing brace line
-                self.premake_content.pop()  # Remove the empty line
-
-                for lib_name, lib_path in late_static_libs:
-                    if lib_name == 'utf8proc':
-                        # Use :libutf8proc.a syntax (path in libdir /usr/lib/aarch64-linux-gnu)
-                        self.premake_content.append('        ":libutf8proc.a",')
-                    else:
-                        self.premake_content.append(f'        "{lib_path}",')
-
-                # Close the links block again
-                self.premake_content.extend([
-                    '    }',
-                    '    '
-                ])
-
             if external_static_libs:
                 if self.use_linux_config:
                     # These archives live outside the normal Linux libdirs;
                     # expose their parent directories before linking them by
                     # basename through the final LIBS sequence.
-                    static_lib_dirs = []
-                    for lib_path in external_static_libs:
-                        lib_dir = os.path.dirname(lib_path)
-                        # Premake resolves relative libdirs from the project
-                        # root; do not pass the build-directory prefix that
-                        # belongs to raw linkoptions paths.
-                        if lib_dir.startswith('../../'):
-                            lib_dir = lib_dir[6:]
-                        if lib_dir and lib_dir not in static_lib_dirs:
-                            static_lib_dirs.append(lib_dir)
+                    # Premake resolves relative libdirs from the project
+                    # root; do not pass the build-directory prefix that
+                    # belongs to raw linkoptions paths.
+                    static_lib_dirs = _dedup_preserve_order(
+                        os.path.dirname(lib_path).removeprefix('../../')
+                        for lib_path in external_static_libs)
                     if static_lib_dirs:
-                        self.premake_content.append('    libdirs {')
-                        for lib_dir in static_lib_dirs:
-                            self.premake_content.append(f'        "{lib_dir}",')
-                        self.premake_content.extend([
-                            '    }',
-                            '    '
-                        ])
+                        lines.extend(_list_block('libdirs', static_lib_dirs))
 
-                    self.premake_content.append('    links {')
+                    lines.append('    links {')
                     for lib_path in external_static_libs:
-                        self.premake_content.append(
+                        lines.append(
                             f'        ":{os.path.basename(lib_path)}",')
-                    self.premake_content.extend([
-                        '    }',
-                        '    '
-                    ])
+                    lines.extend(_CLOSE_BLOCK)
                 else:
-                    self.premake_content.append('    linkoptions {')
-                    for lib_path in external_static_libs:
-                        self.premake_content.append(f'        "{lib_path}",')
+                    lines.append('    linkoptions {')
+                    lines.extend(_quoted_lines(external_static_libs))
                     # Windows: add system libs that static libraries depend on
                     if self.use_windows_config:
-                        self.premake_content.extend([
-                            '        "-lws2_32",',
-                            '        "-lwsock32",',
-                            '        "-lwinmm",',
-                            '        "-lcrypt32",',
-                            '        "-lbcrypt",',
-                            '        "-ladvapi32",',
-                            '        "-lsecur32",',
-                            '        "-lwldap32",',
-                            '        "-liphlpapi",',
-                        ])
-                    self.premake_content.extend([
-                        '    }',
-                        '    '
-                    ])
+                        lines.extend(self._WINDOWS_TEST_NETWORK_LIB_LINES)
+                    lines.extend(_CLOSE_BLOCK)
 
             if self.use_linux_config and internal_project_links:
                 # Keep a complete copy of the static closure inside one GNU ld
@@ -2724,44 +2734,23 @@ class PremakeGenerator:
                 ]
                 group_option = '-Wl,--start-group,' + ','.join(
                     group_members) + ',--end-group'
-                self.premake_content.append('    linkoptions {')
-                self.premake_content.append(f'        "{group_option}",')
-                self.premake_content.extend([
-                    '    }',
-                    '    '
-                ])
+                lines.append('    linkoptions {')
+                lines.append(f'        "{group_option}",')
+                lines.extend(_CLOSE_BLOCK)
 
             # Add framework linkoptions for dynamic libraries with -framework prefix
             framework_flags = []
             for lib_name in libraries:
-                if lib_name in self.external_libraries:
-                    lib_info = self.external_libraries[lib_name]
-                    if lib_info.get('link') == 'dynamic':
-                        lib_path = lib_info.get('lib', '')
-                        if lib_path.startswith('-framework '):
-                            framework_flags.append(lib_path)
+                if self._external_link_kinds.get(lib_name, ('none',))[0] == 'framework':
+                    framework_flags.append(self.external_libraries[lib_name]['lib'])
 
             if framework_flags:
-                self.premake_content.append('    linkoptions {')
-                for flag in framework_flags:
-                    self.premake_content.append(f'        "{flag}",')
-                self.premake_content.extend([
-                    '    }',
-                    '    '
-                ])
+                lines.extend(_list_block('linkoptions', framework_flags))
 
         if self.use_linux_config and internal_project_links:
             # Test archives use the explicit GNU group below; retain project
             # dependencies so their archives are built before the test.
-            self.premake_content.extend([
-                '    dependson {',
-            ])
-            for project_name in internal_project_links:
-                self.premake_content.append(f'        "{project_name}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('dependson', internal_project_links))
 
         if self.use_linux_config and any(
                 configured_targets.get(
@@ -2770,182 +2759,41 @@ class PremakeGenerator:
                 for project_name in internal_project_links):
             # Test DSOs live beside build/lib; embed a self-relative search path
             # so the runner does not depend on a shell-specific LD_LIBRARY_PATH.
-            self.premake_content.extend([
+            lines.extend([
                 '    linkoptions {',
                 '        "-Wl,-rpath,\'$$ORIGIN/../build/lib\'",',
                 '    }',
-                '    '
+                ''
             ])
 
         # Add external library paths for linking when lambda-runtime-full or lambda-data are used
-        has_input_full_deps = any(dep in ['lambda-runtime-full', 'lambda-data'] or dep.startswith('lambda-runtime-full-') or dep.startswith('lambda-data-') for dep in dependencies)
-        if has_input_full_deps:
-            self.premake_content.extend([
-                '    linkoptions {',
-            ])
-
-            # Add --start-group only on Linux for circular dependency resolution
-            if self.use_linux_config:
-                self.premake_content.append('        "-Wl,--start-group",')
-
-            # Add static external libraries with explicit paths like the main lambda program
-            if self.use_windows_config:
-                # Windows: allow multiple definitions to avoid duplicate _Unwind_Resume from libgcc_eh
-                # This is needed because lambda-data DLL includes exception handling code
-                self.premake_content.append('        "-Wl,--allow-multiple-definition",')
-
-                # Windows: use the same explicit paths as the main lambda program
-                windows_lib_paths = [
-                    "../../lambda/tree-sitter/libtree-sitter.a",
-                    "../../lambda/tree-sitter-lambda/libtree-sitter-lambda.a",
-                    "../../win-native-deps/lib/libmir.a",
-                    "/clang64/lib/libmpdec.a",
-                    "../../win-native-deps/lib/libutf8proc.a",
-                    "../../win-native-deps/lib/libcurl.a",
-                    "/clang64/lib/libnghttp2.a",
-                    "/clang64/lib/libnghttp3.a",
-                    "/clang64/lib/libngtcp2_crypto_ossl.a",
-                    "/clang64/lib/libngtcp2.a",
-                    "/clang64/lib/libssh2.a",
-                    "/clang64/lib/libidn2.a",
-                    "/clang64/lib/libunistring.a",
-                    "/clang64/lib/libiconv.a",
-                    "/clang64/lib/libssl.a",
-                    "/clang64/lib/libcrypto.a",
-                    "/clang64/lib/libzstd.a",
-                    "/clang64/lib/libmbedtls.a",
-                    "/clang64/lib/libmbedx509.a",
-                    "/clang64/lib/libmbedcrypto.a",
-                ]
-                for lib_path in windows_lib_paths:
-                    self.premake_content.append(f'        "{lib_path}",')
-                # Add dynamic system libraries
-                self.premake_content.extend([
-                    '        "-lz",',
-                    '        "-lbz2",',
-                    '        "-lfreetype",',
-                    '        "-lpng",',
-                    '        "-limm32",',
-                    '        "-ldbghelp",',
-                    '        "-luserenv",',
-                ])
-                # Non-Windows: use the original approach with external library definitions
-                # If lambda-data is a dependency, we need to include curl/ssl/crypto for proper linking
-                # since static libraries don't propagate their dependencies in Premake
-                # Note: Lambda's custom curl was built with external nghttp2 dependency
-                base_libs = ['mpdec', 'utf8proc', 'mir', 'nghttp2', 'curl', 'ssl', 'crypto']
-                # Add platform-specific readline library
-                base_libs.append('libedit')
-
-                for lib_name in base_libs:
-                    if lib_name in self.external_libraries:
-                        # Skip if this library should be dynamic
-                        if self.external_libraries[lib_name].get('link') == 'dynamic':
-                            continue
-                        lib_path = self.external_libraries[lib_name]['lib']
-                        # Convert to relative path from build directory
-                        if not lib_path.startswith('/'):
-                            lib_path = f"../../{lib_path}"
-
-                        # Force load nghttp2 on macOS to ensure curl can find its symbols
-                        if lib_name == 'nghttp2' and not self.use_windows_config and not self.use_linux_config:
-                            self.premake_content.append(f'        "-Wl,-force_load,{lib_path}",')
-                        else:
-                            self.premake_content.append(f'        "{lib_path}",')
-
-            # Add --end-group only on Linux for circular dependency resolution
-            if self.use_linux_config:
-                self.premake_content.append('        "-Wl,--end-group",')
-
-            self.premake_content.extend([
-                '    }',
-                '    ',
-                '    -- Add dynamic libraries',
-                '    links {'
-            ])
-
-            # Add dynamic libraries (not frameworks)
-            for lib_name in self.external_libraries:
-                if self.external_libraries[lib_name].get('link') == 'dynamic':
-                    lib_flag = self.external_libraries[lib_name]['lib']
-                    # Skip frameworks (they go in linkoptions)
-                    if lib_flag.startswith('-framework '):
-                        continue
-                    if lib_flag.startswith('-l'):
-                        lib_flag = lib_flag[2:]  # Remove -l prefix
-                    self.premake_content.append(f'        "{lib_flag}",')
-
-            # Add system libraries that libedit depends on (Linux only)
-            if not self.use_windows_config:
-                self.premake_content.append('        "ncurses",')
-
-            self.premake_content.extend([
-                '    }',
-                '    ',
-            ])
-
-            self.premake_content.extend([
-                '    -- Add tree-sitter libraries using linkoptions to append to LIBS section',
-                '    linkoptions {',
-            ])
-
-            self.premake_content.extend([
-                '    }',
-                '    ',
-                '    -- Add macOS frameworks',
-                '    linkoptions {'
-            ])
-
-            # Add macOS frameworks using linkoptions
-            for lib_name in self.external_libraries:
-                if self.external_libraries[lib_name].get('link') == 'dynamic':
-                    lib_flag = self.external_libraries[lib_name]['lib']
-                    if lib_flag.startswith('-framework '):
-                        self.premake_content.append(f'        "{lib_flag}",')
-
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+        runtime_data_lines, tree_sitter_lines = self._test_runtime_link_blocks()
+        if self._has_runtime_data_dep(dependencies):
+            lines.extend(runtime_data_lines)
 
         # Add build options based on source file type
         is_cpp_test = source.endswith('.cpp')
-        base_compiler, _ = self._get_compiler_info()
-        build_opts = self._get_build_options(base_compiler)
+        build_opts = self._get_build_options()
 
         if is_cpp_test:
             if cpp_flags:
                 build_opts.append(cpp_flags)
             # Add special flags for C++ tests
-            if special_flags:
-                # Handle special_flags as either string or list
-                if isinstance(special_flags, str):
-                    flag_list = special_flags.split()
+            for flag in special_flags:
+                if flag == '-lstdc++':
+                    lines.extend([
+                        '    links { "stdc++" }',
+                        ''
+                    ])
                 else:
-                    flag_list = special_flags
-
-                for flag in flag_list:
-                    if flag == '-lstdc++':
-                        self.premake_content.extend([
-                            '    links { "stdc++" }',
-                            '    '
-                        ])
-                    else:
-                        build_opts.append(flag)
+                    build_opts.append(flag)
         else:
             # For C files, check if special flags contain a std flag
             has_std_flag = False
-            if special_flags:
-                # Handle special_flags as either string or list
-                if isinstance(special_flags, str):
-                    flag_list = special_flags.split()
-                else:
-                    flag_list = special_flags
-
-                for flag in flag_list:
-                    if flag.startswith('-std='):
-                        has_std_flag = True
-                    build_opts.append(flag)
+            for flag in special_flags:
+                if flag.startswith('-std='):
+                    has_std_flag = True
+                build_opts.append(flag)
 
             # Only add default C99 standard if no std flag was specified
             if not has_std_flag:
@@ -2955,71 +2803,25 @@ class PremakeGenerator:
         # This was fixed by ensuring /opt/homebrew/include comes before /usr/local/include
         # in build_lambda_config.json, so the correct gtest headers are found first
 
-        self.premake_content.extend([
-            '    buildoptions {',
-        ])
-        for opt in build_opts:
-            self.premake_content.append(f'        "{opt}",')
+        lines.append('    buildoptions {')
+        lines.extend(_quoted_lines(build_opts))
 
-        self.premake_content.extend([
-            '    }',
-            '    ',
-        ])
+        lines.extend(_CLOSE_BLOCK)
 
         # Add pthread for Windows test executables (needed by mempool.c, memtrack.c, etc.)
         if self.use_windows_config:
             if 'pthread' in self.external_libraries:
                 lib_path = self.external_libraries['pthread']['lib']
-                self.premake_content.extend([
+                lines.extend([
                     '    linkoptions {',
                     f'        "{lib_path}",',
                     '    }',
-                    '    ',
+                    '',
                 ])
 
         # Add tree-sitter libraries as linker options for tests with lambda-data dependencies
-        # Use platform-specific flags to force inclusion of all symbols from tree-sitter libraries
-        if any(dep == 'lambda-data' for dep in dependencies):
-            self.premake_content.extend([
-                '    filter {}',
-                '    linkoptions {',
-            ])
-
-            if self.use_linux_config:
-                # Linux: use --whole-archive
-                self.premake_content.append('        "-Wl,--whole-archive",')
-                # lambda-data references the LaTeX parser entry points from
-                # its archive, so these archives must remain live after the
-                # data library is placed on the link line.
-                for lib_name in ['tree-sitter-lambda', 'tree-sitter',
-                                 'tree-sitter-latex', 'tree-sitter-latex-math']:
-                    if lib_name in self.external_libraries:
-                        lib_path = self.external_libraries[lib_name]['lib']
-                        if not lib_path.startswith('/'):
-                            lib_path = f"../../{lib_path}"
-                        self.premake_content.append(f'        "{lib_path}",')
-                self.premake_content.append('        "-Wl,--no-whole-archive",')
-            elif self.use_macos_config:
-                # macOS: use -force_load for each library
-                for lib_name in ['tree-sitter-lambda', 'tree-sitter']:
-                    if lib_name in self.external_libraries:
-                        lib_path = self.external_libraries[lib_name]['lib']
-                        if not lib_path.startswith('/'):
-                            lib_path = f"../../{lib_path}"
-                        self.premake_content.append(f'        "-Wl,-force_load,{lib_path}",')
-            else:
-                # Default: just link normally without forcing symbol inclusion
-                for lib_name in ['tree-sitter-lambda', 'tree-sitter']:
-                    if lib_name in self.external_libraries:
-                        lib_path = self.external_libraries[lib_name]['lib']
-                        if not lib_path.startswith('/'):
-                            lib_path = f"../../{lib_path}"
-                        self.premake_content.append(f'        "{lib_path}",')
-
-            self.premake_content.extend([
-                '    }',
-                '    ',
-            ])
+        if 'lambda-data' in dependencies:
+            lines.extend(tree_sitter_lines)
 
         # Test executables default to fast debug builds without ASan. Keep ASan
         # opt-in for targeted sanitizer test runs.
@@ -3037,49 +2839,51 @@ class PremakeGenerator:
             disable_sanitizer = True
 
         if not disable_sanitizer:
-            self.premake_content.extend([
+            lines.extend([
                 '    -- AddressSanitizer for test projects (opt-in)',
                 '    filter { "configurations:debug", "not platforms:Linux_x64" }',
                 '        buildoptions { "-fsanitize=address", "-fno-omit-frame-pointer" }',
                 '        linkoptions { "-fsanitize=address" }',
-                '    ',
+                '',
                 '    filter {}',
-                '    ',
+                '',
             ])
 
-        self.premake_content.append('')
+        lines.append('')
+        return lines
 
     def generate_main_program(self) -> None:
         """Generate the main Lambda program executable"""
         output = self.config.get('output', 'lambda.exe')
         source_files = self.config.get('source_files', [])
         source_dirs = self.config.get('source_dirs', [])
-        dependencies = []
+        platforms_config = self.config.get('platforms', {})
+        current_platform = platform.system()
+        # Ordered set of dependency names (dict keys keep insertion order)
+        dependencies = {}
 
         # Extract main program dependencies from libraries
         for lib in self.config.get('libraries', []):
             # Handle both string and object formats
             if isinstance(lib, str):
                 # String format: just library name
-                if lib not in ['criterion']:  # Exclude test-only libraries
-                    dependencies.append(lib)
+                if lib not in self._TEST_ONLY_LIBS:
+                    dependencies[lib] = None
             elif isinstance(lib, dict):
                 lib_name = lib.get('name', '')
-                if lib_name not in ['criterion']:  # Exclude test-only libraries
-                    dependencies.append(lib_name)
+                if lib_name not in self._TEST_ONLY_LIBS:
+                    dependencies[lib_name] = None
 
         # Add platform-specific libraries for Windows
         # Platform-specific libraries may override global ones for correct ordering
-        platforms_config = self.config.get('platforms', {})
         if self.use_windows_config:
             windows_config = platforms_config.get('windows', {})
             for lib in windows_config.get('libraries', []):
                 lib_name = lib.get('name', '')
-                if lib_name and lib_name not in ['criterion']:
-                    # Remove from current position if it exists (to respect platform ordering)
-                    if lib_name in dependencies:
-                        dependencies.remove(lib_name)
-                    dependencies.append(lib_name)
+                if lib_name and lib_name not in self._TEST_ONLY_LIBS:
+                    # Move to the end if it exists (to respect platform ordering)
+                    dependencies.pop(lib_name, None)
+                    dependencies[lib_name] = None
 
         # Add platform-specific libraries for Linux
         # Platform-specific libraries may override global ones for correct ordering
@@ -3087,21 +2891,18 @@ class PremakeGenerator:
             linux_config = platforms_config.get('linux', {})
             for lib in linux_config.get('libraries', []):
                 lib_name = lib.get('name', '')
-                if lib_name and lib_name not in ['criterion']:
-                    # Remove from current position if it exists (to respect platform ordering)
-                    if lib_name in dependencies:
-                        dependencies.remove(lib_name)
-                    dependencies.append(lib_name)
+                if lib_name and lib_name not in self._TEST_ONLY_LIBS:
+                    # Move to the end if it exists (to respect platform ordering)
+                    dependencies.pop(lib_name, None)
+                    dependencies[lib_name] = None
 
         # Add platform-specific libraries for macOS
-        import platform
-        current_platform = platform.system()
         if current_platform == 'Darwin':
             macos_config = platforms_config.get('macos', {})
             for lib in macos_config.get('libraries', []):
                 lib_name = lib.get('name', '')
-                if lib_name and lib_name not in dependencies:
-                    dependencies.append(lib_name)
+                if lib_name:
+                    dependencies.setdefault(lib_name)
 
         # Filter out libraries excluded by variant (e.g., cli headless build)
         if self.variant:
@@ -3111,7 +2912,8 @@ class PremakeGenerator:
             all_excluded = exclude_libs | exclude_macos_libs
             if all_excluded:
                 vlog(f"DEBUG: Variant '{self.variant}' excluding libraries: {all_excluded}")
-                dependencies = [d for d in dependencies if d not in all_excluded]
+                for lib_name in all_excluded:
+                    dependencies.pop(lib_name, None)
 
         # NOTE: dev_libraries (ginac, cln, gmp, criterion, catch2) are NOT included
         # in the main program - they are only for development and testing
@@ -3131,7 +2933,6 @@ class PremakeGenerator:
         additional_files = self.config.get('additional_source_files', []).copy()
 
         # Then add platform-specific exclusions and additions
-        platforms_config = self.config.get('platforms', {})
         if self.use_windows_config:
             windows_config = platforms_config.get('windows', {})
             exclude_files.extend(windows_config.get('exclude_source_files', []))
@@ -3145,24 +2946,11 @@ class PremakeGenerator:
             exclude_files.extend(macos_config.get('exclude_source_files', []))
             additional_files.extend(macos_config.get('additional_source_files', []))
 
+        # C, then C++, then (macOS only) Objective-C++ files from each
+        # source directory (one level only, non-recursive)
+        source_suffixes = ('.c', '.cpp', '.mm') if self.use_macos_config else ('.c', '.cpp')
         for source_dir in source_dirs:
-            import glob
-            c_pattern = f"{source_dir}/*.c"
-            cpp_pattern = f"{source_dir}/*.cpp"
-
-            # Find all C files (one level only, non-recursive)
-            c_files = glob.glob(c_pattern, recursive=False)
-            all_source_files.extend(c_files)
-
-            # Find all C++ files (one level only, non-recursive)
-            cpp_files = glob.glob(cpp_pattern, recursive=False)
-            all_source_files.extend(cpp_files)
-
-            # Find Objective-C++ files on macOS (one level only, non-recursive)
-            if self.use_macos_config:
-                mm_pattern = f"{source_dir}/*.mm"
-                mm_files = glob.glob(mm_pattern, recursive=False)
-                all_source_files.extend(mm_files)
+            all_source_files.extend(_scan_sources(source_dir, source_suffixes))
 
         # On macOS, remove _stub.cpp files when a platform-specific .mm exists
         # e.g., rdt_video_stub.cpp is excluded when rdt_video_avf.mm is present
@@ -3172,7 +2960,6 @@ class PremakeGenerator:
                 if f.endswith('.mm'):
                     # Extract the base name before the platform suffix
                     # e.g., radiant/rdt_video_avf.mm -> rdt_video
-                    import re
                     base = os.path.basename(f)
                     m = re.match(r'(.+?)_(?:avf|mac|macos|cg)\.mm$', base)
                     if m:
@@ -3188,18 +2975,16 @@ class PremakeGenerator:
 
         # Remove excluded files
         if exclude_files:
-            all_source_files = [f for f in all_source_files if f not in exclude_files]
+            exclude_set = set(exclude_files)
+            all_source_files = [f for f in all_source_files if f not in exclude_set]
 
         # Add additional platform-specific files
         if additional_files:
             all_source_files.extend(additional_files)
 
-        self.premake_content.extend([
-            f'project "{project_name}"',
-            '    kind "ConsoleApp"',
-            '    language "C++"',  # Use C++ as primary language since we have mixed sources
-            '    targetdir "."',
-            '    objdir "build/obj/%{prj.name}"',
+        lines = [
+            # C++ is the primary language since the sources are mixed
+            _PROJECT_HEADER_TEMPLATE.format(name=project_name, kind='ConsoleApp', language='C++', target_dir='.'),
             f'    targetname "{target_name}"',
             f'    targetextension "{target_extension}"',
             '    filter "configurations:release_profile"',
@@ -3207,18 +2992,14 @@ class PremakeGenerator:
             '    filter "configurations:debug_profile"',
             f'        targetname "{target_name}-debug-profile"',
             '    filter {}',
-            '    ',
+            '',
             '    files {',
-        ])
+        ]
 
         # Add all source files explicitly
-        for source in all_source_files:
-            self.premake_content.append(f'        "{source}",')
+        lines.extend(_quoted_lines(all_source_files))
 
-        self.premake_content.extend([
-            '    }',
-            '    ',
-        ])
+        lines.extend(_CLOSE_BLOCK)
 
         # Add include directories using consolidated includes
         all_includes = []
@@ -3250,272 +3031,170 @@ class PremakeGenerator:
                 all_includes.append(lib_info['include'])
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_includes = []
-        for include in all_includes:
-            if include and include not in seen:
-                unique_includes.append(include)
-                seen.add(include)
+        unique_includes = _dedup_preserve_order(all_includes)
 
         if unique_includes:
-            self.premake_content.extend([
-                '    includedirs {',
-            ])
-            for include_path in unique_includes:
-                self.premake_content.append(f'        "{include_path}",')
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_list_block('includedirs', unique_includes))
 
-        self.premake_content.extend([
-            '    libdirs {',
-        ])
+        lines.append('    libdirs {')
 
         # Add platform-specific library paths
         if self.use_windows_config:
-            self.premake_content.extend([
+            lines.extend([
                 '        "/clang64/lib",',
                 '        "win-native-deps/lib",',
                 '        "build/lib",',
             ])
         else:
-            self.premake_content.extend([
+            lines.extend([
                 '        "/opt/homebrew/lib",',
                 '        "/usr/local/lib",',
             ])
 
-        self.premake_content.extend([
-            '    }',
-            '    '
-        ])
+        lines.extend(_CLOSE_BLOCK)
 
-        # Add static library linkoptions
+        # Classify external dependencies in a single pass; libraries with
+        # link type "none" are skipped. linux_static_libs is the subset
+        # explicitly marked static, for the Linux cross-compilation filter.
         static_libs = []
+        linux_static_libs = []
         frameworks = []
         dynamic_libs = []
 
         for dep in dependencies:
-            if dep in self.external_libraries:
-                lib_info = self.external_libraries[dep]
-
-                # Skip libraries with link type "none"
-                if lib_info.get('link') == 'none':
-                    continue
-
-                lib_path = lib_info['lib']
-
-                if lib_info.get('link') == 'dynamic':
-                    if lib_path.startswith('-framework '):
-                        frameworks.append(lib_path)
-                    elif lib_path.startswith('-l'):
-                        dynamic_libs.append(lib_path.replace('-l', ''))
-                    else:
-                        dynamic_libs.append(lib_path)
-                else:
-                    # Static library
-                    if not lib_path.startswith('/') and not lib_path.startswith('-l'):
-                        lib_path = f"../../{lib_path}"
-                    static_libs.append(lib_path)
+            kind, value = self._external_link_kinds.get(dep, ('none', None))
+            if kind == 'framework':
+                frameworks.append(self.external_libraries[dep]['lib'])
+            elif kind == 'dynamic':
+                dynamic_libs.append(value)
+            elif kind == 'static':
+                static_libs.append(self._build_lib_paths[dep])
+                if self.external_libraries[dep]['link'] == 'static':
+                    linux_static_libs.append(self._build_lib_paths[dep])
 
         # Add static libraries to linkoptions
         if static_libs:
-            self.premake_content.append('    linkoptions {')
-            for lib_path in static_libs:
-                self.premake_content.append(f'        "{lib_path}",')
+            lines.append('    linkoptions {')
+            lines.extend(_quoted_lines(static_libs))
 
             # Add platform-specific additional libraries for static linking
             # These are the same libraries that test projects include
-            # Note: Lambda's custom curl was built with external nghttp2 dependency
-            base_libs = ['mpdec', 'utf8proc', 'mir', 'nghttp2', 'curl', 'ssl', 'crypto', 'hpdf']
+            base_libs = self._BASE_STATIC_LIBS + ('hpdf',)
             # Add platform-specific readline library
-            if self.use_windows_config:
-                # Windows: skip readline/ncurses to avoid DLL dependencies
-                pass
-            else:
-                base_libs.append('libedit')
-
-            # Add these libraries if they're not already included and exist in external_libraries
-            for lib_name in base_libs:
-                if lib_name in self.external_libraries:
-                    lib_info = self.external_libraries[lib_name]
-
-                    # Skip libraries with link type "none"
-                    if lib_info.get('link') == 'none':
-                        continue
+            # (Windows: skip readline/ncurses to avoid DLL dependencies)
+            if not self.use_windows_config:
+                base_libs += ('libedit',)
 
-                    if lib_info.get('link') != 'dynamic':
-                        lib_path = lib_info['lib']
-                        if not lib_path.startswith('/') and lib_path:
-                            lib_path = f"../../{lib_path}"
-                        if lib_path and lib_path != "../../":
-                            # Force load nghttp2 on macOS to ensure curl can find its symbols
-                            if lib_name == 'nghttp2' and not self.use_windows_config and not self.use_linux_config:
-                                self.premake_content.append(f'        "-Wl,-force_load,{lib_path}",')
-                            else:
-                                self.premake_content.append(f'        "{lib_path}",')
+            # Add these libraries if they exist in external_libraries
+            base_lib_paths = self._static_lib_paths(base_libs)
+            if not self.use_linux_config:
+                # ld64 and lld resolve archives regardless of their position,
+                # so an archive already listed above only costs another scan.
+                # GNU ld on Linux scans once left to right; there a repeat can
+                # still satisfy references from archives after the first copy.
+                listed_static_libs = set(static_libs)
+                base_lib_paths = [path for path in base_lib_paths if path not in listed_static_libs]
+            lines.extend(_quoted_lines(base_lib_paths))
 
             # Add OpenGL libraries for Linux (must come after ThorVG static library)
             # Skip for headless CLI variant which excludes ThorVG
             if self.use_linux_config and not self.variant:
-                self.premake_content.append('        -- OpenGL and OpenMP libraries (required by ThorVG)')
-                self.premake_content.append('        "-lGL",')
-                self.premake_content.append('        "-lGLU",')
-                self.premake_content.append('        "-lgomp",')
+                lines.append('        -- OpenGL and OpenMP libraries (required by ThorVG)')
+                lines.extend(_quoted_lines(('-lGL', '-lGLU', '-lgomp')))
 
-            self.premake_content.extend([
-                '    }',
-                '    '
-            ])
+            lines.extend(_CLOSE_BLOCK)
 
         # Add platform-specific linker options
-        output = self.config.get('output', 'lambda.exe')
         if 'linux' in output.lower():
             # Linux-specific static libraries
-            self.premake_content.extend([
+            lines.extend([
                 '    -- Linux cross-compilation static libraries',
                 '    filter "platforms:Linux_x64"',
                 '        linkoptions {',
             ])
 
             # Add Linux static libraries from config
-            linux_libs = []
-            for dep in dependencies:
-                if dep in self.external_libraries:
-                    lib_info = self.external_libraries[dep]
+            lines.extend(_quoted_lines(linux_static_libs, indent=12))
 
-                    # Skip libraries with link type "none"
-                    if lib_info.get('link') == 'none':
-                        continue
-
-                    if lib_info.get('link') == 'static':
-                        lib_path = lib_info['lib']
-                        if not lib_path.startswith('/'):
-                            lib_path = f"../../{lib_path}"
-                        linux_libs.append(lib_path)
-
-            for lib_path in linux_libs:
-                self.premake_content.append(f'            "{lib_path}",')
-
-            self.premake_content.extend([
-                '        }',
-                '    ',
-                '    filter {}',
-                '    '
-            ])
+            lines.extend(_CLOSE_NESTED_FILTER_BLOCK)
 
         # Add dynamic libraries and frameworks (macOS only)
         # Always add dynamic libraries section for cross-platform compatibility
-        self.premake_content.extend([
+        lines.extend([
             '    -- Dynamic libraries',
             '    filter "platforms:native"',
             '        links {',
         ])
 
         # Add all dynamic libraries
-        for lib in dynamic_libs:
-            self.premake_content.append(f'            "{lib}",')
+        lines.extend(_quoted_lines(dynamic_libs, indent=12))
 
         # Add Windows system libraries if on Windows
         if self.use_windows_config:
-            windows_dynamic_libs = []
-            for dep in dependencies:
-                if dep in self.external_libraries:
-                    lib_info = self.external_libraries[dep]
-                    if lib_info.get('link') == 'dynamic':
-                        lib_flag = lib_info['lib']
-                        if lib_flag.startswith('-l'):
-                            lib_flag = lib_flag[2:]  # Remove -l prefix
-                        if lib_flag not in dynamic_libs:
-                            windows_dynamic_libs.append(lib_flag)
-
-            for lib in windows_dynamic_libs:
-                self.premake_content.append(f'            "{lib}",')
-
-        self.premake_content.extend([
-            '        }',
-            '    '
-        ])
+            # Every other dynamic library is already in dynamic_libs, so
+            # only the framework entries remain to be linked here
+            windows_dynamic_libs = [lib_flag for lib_flag in frameworks if lib_flag not in dynamic_libs]
 
-        import platform
-        current_platform = platform.system()
+            lines.extend(_quoted_lines(windows_dynamic_libs, indent=12))
+
+        lines.extend(_CLOSE_NESTED_BLOCK)
 
         # Only add frameworks on macOS
         if frameworks and current_platform == 'Darwin':
-            self.premake_content.extend([
-                '        linkoptions {',
-            ])
-            for framework in frameworks:
-                self.premake_content.append(f'            "{framework}",')
-            self.premake_content.extend([
-                '        }',
-                '    ',
-                '    filter {}',
-                '    '
-            ])
+            lines.append('        linkoptions {')
+            lines.extend(_quoted_lines(frameworks, indent=12))
+            lines.extend(_CLOSE_NESTED_FILTER_BLOCK)
         else:
-            self.premake_content.extend([
-                '    filter {}',
-                '    '
-            ])
+            lines.extend(_RESET_FILTER_BLOCK)
 
         # Add build options with separate handling for C and C++ files
-        base_compiler, _ = self._get_compiler_info()
-        build_opts = self._get_build_options(base_compiler)
+        build_opts = self._get_build_options()
 
-        self.premake_content.extend([
-            '    buildoptions {',
-        ])
-        for opt in build_opts:
-            self.premake_content.append(f'        "{opt}",')
-        self.premake_content.extend([
+        lines.append('    buildoptions {')
+        lines.extend(_quoted_lines(build_opts))
+        lines.extend([
             '    }',
-            '    ',
+            '',
             '    -- C++ specific options',
             '    filter "files:**.cpp"',
         ])
         cpp_standard = self._get_cpp_standard()
-        self.premake_content.extend([
+        lines.extend([
             f'        buildoptions {{ "-std={cpp_standard}" }}',
-            '    ',
+            '',
             '    -- C specific options',
             '    filter "files:**.c"',
             '        buildoptions { "-std=c11" }',
-            '    ',
+            '',
             '    filter {}',
-            '    ',
+            '',
         ])
 
         if self.use_macos_config:
-            platforms_config = self.config.get('platforms', {})
             macos_config = platforms_config.get('macos', {})
             linker_flags = macos_config.get('linker_flags', [])
             if linker_flags:
-                self.premake_content.append('    linkoptions {')
-                for flag in linker_flags:
-                    opt = f'-{flag}' if not flag.startswith('-') else flag
-                    self.premake_content.append(f'        "{opt}",')
-                self.premake_content.extend([
-                    '    }',
-                    '    ',
-                ])
+                lines.append('    linkoptions {')
+                lines.extend(_quoted_lines(
+                    flag if flag[:1] == '-' else '-' + flag for flag in linker_flags))
+                lines.extend(_CLOSE_BLOCK)
 
         if self.use_linux_config:
             # Linux Jube DSOs resolve their host ABI from the executable; export
             # those definitions in every host configuration, including debug.
-            self.premake_content.extend([
+            lines.extend([
                 '    linkoptions { "-Wl,--export-dynamic" }',
-                '    ',
+                '',
             ])
 
-        self.premake_content.extend([
+        lines.extend([
             '    defines {',
             '        "_GNU_SOURCE",',
         ])
 
         # Add Windows-specific defines for the main lambda project
         if self.use_windows_config:
-            self.premake_content.extend([
+            lines.extend([
                 '        "WIN32",',
                 '        "_WIN32",',
                 '        "NATIVE_WINDOWS_BUILD",',
@@ -3525,12 +3204,11 @@ class PremakeGenerator:
 
         # Add variant-specific defines (e.g., LAMBDA_HEADLESS for cli build)
         variant_defines = self.config.get('defines', [])
-        for d in variant_defines:
-            self.premake_content.append(f'        "{d}",')
+        lines.extend(_quoted_lines(variant_defines))
 
-        self.premake_content.extend([
+        lines.extend([
             '    }',
-            '    ',
+            '',
             ''
         ])
 
@@ -3540,27 +3218,23 @@ class PremakeGenerator:
             poison_dirs = self.config.get('memtrack_poison_dirs', ['lambda', 'radiant'])
             exempt_files = self.config.get('memtrack_poison_exempt', [])
             for pdir in poison_dirs:
-                self.premake_content.extend([
+                lines.extend([
                     f'    -- Memtrack poison enforcement for {pdir}/',
                     f'    filter "files:{pdir}/**"',
                     '        buildoptions { "-include lib/mem.h", "-DMEMTRACK_POISON_RAW_ALLOC" }',
-                    '    ',
+                    '',
                 ])
             # Exempt specific files (e.g., WASM build, tree-sitter bindings)
             for exempt in exempt_files:
-                self.premake_content.extend([
+                lines.extend([
                     f'    filter "files:{exempt}"',
                     '        buildoptions { "-UMEMTRACK_POISON_RAW_ALLOC" }',
-                    '    ',
+                    '',
                 ])
-            self.premake_content.extend([
-                '    filter {}',
-                '    ',
-            ])
+            lines.extend(_RESET_FILTER_BLOCK)
 
         # AddressSanitizer for main lambda.exe (opt-in via enable_sanitizer_main)
         if self.config.get('enable_sanitizer_main', False):
-            platforms_config = self.config.get('platforms', {})
             disable_sanitizer = False
             if self.use_windows_config:
                 windows_config = platforms_config.get('windows', {})
@@ -3570,20 +3244,91 @@ class PremakeGenerator:
                 disable_sanitizer = linux_config.get('disable_sanitizer', False)
 
             if not disable_sanitizer:
-                self.premake_content.extend([
+                lines.extend([
                     '    -- AddressSanitizer for main lambda.exe',
                     '    filter "configurations:debug"',
                     '        buildoptions { "-fsanitize=address", "-fno-omit-frame-pointer" }',
                     '        linkoptions { "-fsanitize=address" }',
-                    '    ',
+                    '',
                     '    filter {}',
-                    '    ',
+                    '',
                 ])
+        self._emit(lines)
+
+    def _test_file_exists(self, path: str) -> bool:
+        """Whether a test source exists, scanning each directory once
 
-    def generate_premake_file(self, output_path: str = "premake5.lua") -> None:
-        """Generate the complete premake5.lua file"""
+        Exact-case names of regular files are answered from the directory
+        listing; anything else (a name differing only in case on a
+        case-insensitive filesystem, a directory, a symlink) falls back to
+        os.path.exists so the result always matches a direct check.
+        """
+        directory, name = os.path.split(path)
+        files = self._test_dir_files.get(directory)
+        if files is None:
+            try:
+                with os.scandir(directory or '.') as entries:
+                    files = frozenset(entry.name for entry in entries if entry.is_file())
+            except OSError:
+                files = frozenset()
+            self._test_dir_files[directory] = files
+        return name in files or os.path.exists(path)
+
+    def _generation_key(self, output_path: str) -> str:
+        """Hash every input that shapes the generated premake file
+
+        Covers this script, the fully resolved config (variant overlay,
+        expanded targets and environment-provided defines included), the
+        selected platform and output path, the host OS and CPU architecture,
+        the source directory listings, which configured test sources exist,
+        and linker availability.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(__file__, 'rb') as f:
+            digest.update(f.read())
+        digest.update(json.dumps(self.config, sort_keys=True, default=str).encode('utf-8'))
+        digest.update(repr((
+            self.use_linux_config, self.use_macos_config, self.use_windows_config,
+            self.variant, os.path.abspath(output_path),
+            platform.system(), platform.machine(),
+            shutil.which('lld') or shutil.which('ld.lld'), shutil.which('mold'),
+        )).encode('utf-8'))
+        for source_dir in self.config.get('source_dirs', []):
+            try:
+                names = sorted(os.listdir(source_dir))
+            except OSError:
+                names = []
+            digest.update(f'{source_dir}:{"|".join(names)}\n'.encode('utf-8'))
+        for suite in self.config.get('test', {}).get('test_suites', []):
+            for test in suite.get('tests', []):
+                source = test.get('source', '')
+                test_file_path = source if source.startswith("test/") else f"test/{source}"
+                digest.update(f'{test_file_path}:{self._test_file_exists(test_file_path)}\n'.encode('utf-8'))
+        return digest.hexdigest()
+
+    def generate_premake_file(self, output_path: str = "premake5.lua", force: bool = False) -> None:
+        """Generate the complete premake5.lua file
+
+        A stamp next to the output records the inputs of the last successful
+        run together with the output's mtime and size; when nothing changed
+        and the output was not touched since, generation is skipped unless
+        force is set.
+        """
         vlog(f"DEBUG: Starting premake file generation, output_path={output_path}")
 
+        stamp_path = f"{output_path}.stamp"
+        generation_key = self._generation_key(output_path)
+        if not force:
+            try:
+                with open(stamp_path, 'r', encoding='utf-8') as f:
+                    up_to_date = f.read().strip() == _stamp_record(generation_key, output_path)
+            except OSError:
+                # A missing stamp or output means regenerating
+                up_to_date = False
+            if up_to_date:
+                vlog(f"Premake file is up to date: {output_path}")
+                return
+
         # Determine platform from filename or current platform detection
         platform_name = "unknown"
         if "mac" in output_path.lower():
@@ -3599,53 +3344,73 @@ class PremakeGenerator:
         elif self.use_windows_config:
             platform_name = "Windows"
 
-        self.premake_content = []
-
-        # Add header comment with platform information
-        self.premake_content.extend([
-            f'-- Generated by utils/generate_premake.py for {platform_name}',
-            '-- Lambda Build System Premake5 Configuration',
-            f'-- Platform: {platform_name}',
-            '-- DO NOT EDIT MANUALLY - Regenerate using: python3 utils/generate_premake.py',
-            '',
-        ])
-
-        vlog(f"DEBUG: Added header comment for {platform_name}")
-
-        # Generate all sections
-        vlog("DEBUG: Generating workspace...")
-        self.generate_workspace()
-        vlog("DEBUG: Generating library projects...")
-        self.generate_library_projects()
-        vlog("DEBUG: Generating complex libraries...")
-        self.generate_complex_libraries()
-        vlog("DEBUG: Generating main program...")
-        self.generate_main_program()
-        vlog("DEBUG: Generating test projects...")
-        self.generate_test_projects()
-
-        vlog(f"DEBUG: Total premake content lines: {len(self.premake_content)}")
-
-        # Write to file
+        # Sections are streamed into a sibling temporary file as they are
+        # generated, which replaces the output only once it is complete; an
+        # interrupted run never leaves a truncated premake file behind. The
+        # name is per process so concurrent runs never share a temporary.
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
         try:
             vlog(f"DEBUG: Attempting to write to {output_path}")
-            with open(output_path, 'w') as f:
-                content_str = '\n'.join(self.premake_content)
-                f.write(content_str)
-                vlog(f"DEBUG: Successfully wrote {len(content_str)} characters to {output_path}")
-            vlog(f"Generated {platform_name} premake file: {output_path}")
-
+            output_file = open(tmp_path, 'w', buffering=1 << 20)
         except IOError as e:
             elog(f"Error writing {output_path}: {e}")
             sys.exit(1)
 
+        try:
+            with output_file:
+                self.premake_content = output_file
+                self._emitted_sections = 0
+
+                # Add header comment with platform information
+                self._emit([
+                    f'-- Generated by utils/generate_premake.py for {platform_name}',
+                    '-- Lambda Build System Premake5 Configuration',
+                    f'-- Platform: {platform_name}',
+                    '-- DO NOT EDIT MANUALLY - Regenerate using: python3 utils/generate_premake.py',
+                    '',
+                ])
+
+                vlog(f"DEBUG: Added header comment for {platform_name}")
+
+                # Generate all sections
+                vlog("DEBUG: Generating workspace...")
+                self.generate_workspace()
+                vlog("DEBUG: Generating library projects...")
+                self.generate_library_projects()
+                vlog("DEBUG: Generating complex libraries...")
+                self.generate_complex_libraries()
+                vlog("DEBUG: Generating main program...")
+                self.generate_main_program()
+                vlog("DEBUG: Generating test projects...")
+                self.generate_test_projects()
+
+                if _VERBOSE:
+                    vlog(f"DEBUG: Total premake sections: {self._emitted_sections}")
+                    vlog(f"DEBUG: Successfully wrote {output_file.tell()} characters to {output_path}")
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        if _same_file_content(tmp_path, output_path):
+            # Leave an identical output untouched so its mtime does not
+            # trigger premake/make work downstream
+            os.remove(tmp_path)
+            vlog(f"Premake file unchanged: {output_path}")
+        else:
+            os.replace(tmp_path, output_path)
+        try:
+            with open(stamp_path, 'w', encoding='utf-8') as f:
+                f.write(_stamp_record(generation_key, output_path) + '\n')
+        except OSError as e:
+            # Without a stamp the next run simply regenerates
+            elog(f"Warning: could not write {stamp_path}: {e}")
+        vlog(f"Generated {platform_name} premake file: {output_path}")
+
     def validate_config(self) -> bool:
         """Validate the JSON configuration"""
-        required_sections = ['libraries']
-        for section in required_sections:
-            if section not in self.config:
-                elog(f"Error: Missing required section '{section}' in configuration")
-                return False
+        missing = self._REQUIRED_SECTIONS - self.config.keys()
+        if missing:
+            elog(f"Error: Missing required sections {sorted(missing)} in configuration")
+            return False
 
         # Test section is optional for non-test builds (like Linux cross-compilation)
         if 'test' in self.config:
@@ -3656,93 +3421,157 @@ class PremakeGenerator:
 
         return True
 
+def _create_generator(config_file, explicit_platform, variant):
+    """Construct the generator, exiting with a message if the config cannot be read."""
+    try:
+        return PremakeGenerator(config_file, explicit_platform, variant)
+    except FileNotFoundError as e:
+        elog(f"Error: Configuration file not found: {e.filename}")
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        elog(f"Error: Invalid JSON in {config_file}: {e}")
+        sys.exit(1)
+
+def _generate_platform_file(config_file, platform_key, variant, force, verbose):
+    """Write the default premake file for one platform; used by --all.
+
+    Runs in a worker process when platforms are generated in parallel, so the
+    verbosity is passed in rather than inherited. Returns the output path.
+    """
+    global _VERBOSE
+    _VERBOSE = verbose
+    generator = _create_generator(config_file, platform_key, variant)
+    if not generator.validate_config():
+        sys.exit(1)
+    platform_output = _PREMAKE_FILES[platform_key]
+    generator.generate_premake_file(platform_output, force=force)
+    return platform_output
+
 def main():
     """Main entry point"""
     global _VERBOSE
-    _VERBOSE = ('--verbose' in sys.argv) or ('-V' in sys.argv)
+    parser = argparse.ArgumentParser(
+        description="Generate a platform-specific premake5 file from build_lambda_config.json."
+    )
+    parser.add_argument("paths", nargs="*", metavar="PATH",
+                        help="config (.json) and/or output (.lua) file; otherwise the "
+                             "first is the config and the second the output")
+    parser.add_argument("--config", "-c", help="config file (default: build_lambda_config.json)")
+    parser.add_argument("--output", "-o", help="output file (default: premake5.<platform>.lua)")
+    parser.add_argument("--platform", "-p", type=str.lower,
+                        help="target platform: mac, linux or windows (default: host)")
+    parser.add_argument("--all", "-a", action="store_true",
+                        help="generate premake5.<platform>.lua for every platform in one run")
+    parser.add_argument("--variant", "-v", type=str.lower,
+                        help="build variant overlay, e.g. 'cli' for the headless build")
+    parser.add_argument("--force", "-f", action="store_true",
+                        help="regenerate even if the inputs are unchanged")
+    parser.add_argument("--verbose", "-V", action="store_true",
+                        help="show progress and DEBUG output")
+    args = parser.parse_args()
+    _VERBOSE = args.verbose or _VERBOSE
     vlog(f"DEBUG: sys.argv = {sys.argv}")
 
     config_file = "build_lambda_config.json"
     output_file = None  # Will be determined based on platform
-    explicit_platform = None
-    variant = None  # Build variant (e.g., 'cli' for headless build)
-
-    # Parse command line arguments
-    i = 1
-    while i < len(sys.argv):
-        arg = sys.argv[i]
-        if arg in ['--verbose', '-V']:
-            i += 1
-        elif arg in ['--output', '-o'] and i + 1 < len(sys.argv):
-            output_file = sys.argv[i + 1]
-            i += 2
-        elif arg in ['--config', '-c'] and i + 1 < len(sys.argv):
-            config_file = sys.argv[i + 1]
-            i += 2
-        elif arg in ['--platform', '-p'] and i + 1 < len(sys.argv):
-            explicit_platform = sys.argv[i + 1].lower()
-            i += 2
-        elif arg in ['--variant', '-v'] and i + 1 < len(sys.argv):
-            variant = sys.argv[i + 1].lower()
-            i += 2
-        elif arg.endswith('.json'):
-            config_file = arg
-            i += 1
-        elif arg.endswith('.lua'):
-            output_file = arg
-            i += 1
-        else:
+    for index, path in enumerate(args.paths):
+        role = _PATH_ROLES.get(os.path.splitext(path)[1])
+        if role == 'config':
+            config_file = path
+        elif role == 'output':
+            output_file = path
+        elif index == 0:
             # Assume it's a config file if not a lua file
-            if i == 1:
-                config_file = arg
-            elif i == 2 and output_file is None:
-                output_file = arg
-            i += 1
+            config_file = path
+        elif index == 1 and output_file is None:
+            output_file = path
+    # Explicit options take precedence over positional paths
+    config_file = args.config or config_file
+    output_file = args.output or output_file
+    explicit_platform = args.platform
+    variant = args.variant  # Build variant (e.g., 'cli' for headless build)
+    force = args.force  # Regenerate even if the inputs are unchanged
+
+    if args.all:
+        if output_file or explicit_platform:
+            elog("Error: --all writes the default file for every platform; drop --output/--platform")
+            sys.exit(1)
+        # Each platform gets its own generator, as the platform selection
+        # shapes the parsed libraries. The platforms are independent, so with
+        # spare cores they are rendered in parallel worker processes (which
+        # share the config through the pickle cache); on a single core they
+        # run in this process, where the interpreter starts and the config is
+        # parsed only once.
+        # A platform that fails (e.g. its prerequisites cannot be prepared on
+        # this host) is reported and skipped; the others are still written.
+        jobs = [(config_file, platform_key, variant, force, _VERBOSE) for platform_key in _PREMAKE_FILES]
+        outputs = []
+        failed = []
+
+        def record_failure(platform_key, error):
+            # SystemExit means the error was already reported through elog
+            if not isinstance(error, SystemExit):
+                elog(f"Error: could not generate {_PREMAKE_FILES[platform_key]}: {error}")
+            failed.append(platform_key)
+
+        if (os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count())) as pool:
+                futures = [(job[1], pool.submit(_generate_platform_file, *job)) for job in jobs]
+                for platform_key, future in futures:
+                    try:
+                        outputs.append(future.result())
+                    except (Exception, SystemExit) as e:
+                        record_failure(platform_key, e)
+        else:
+            for job in jobs:
+                try:
+                    outputs.append(_generate_platform_file(*job))
+                except (Exception, SystemExit) as e:
+                    record_failure(job[1], e)
+        for platform_output in outputs:
+            vlog(f"Generated platform-specific file: {platform_output}")
+        if failed:
+            elog(f"Error: --all could not generate: {', '.join(failed)}")
+            sys.exit(1)
+        return
 
     # Determine platform if not explicitly set via output filename
     if output_file is None:
         # Auto-detect platform and generate appropriate filename
-        current_platform = platform.system()
         if explicit_platform:
-            if explicit_platform in ['mac', 'macos', 'darwin']:
-                output_file = "premake5.mac.lua"
-            elif explicit_platform in ['linux', 'lin']:
-                output_file = "premake5.lin.lua"
-            elif explicit_platform in ['windows', 'win']:
-                output_file = "premake5.win.lua"
-            else:
+            platform_key = _PLATFORM_ALIASES.get(explicit_platform)
+            if platform_key is None:
                 elog(f"Error: Unknown platform '{explicit_platform}'. Use 'mac', 'linux', or 'windows'")
                 sys.exit(1)
-        elif current_platform == 'Darwin':
-            output_file = "premake5.mac.lua"
-        elif current_platform == 'Linux':
-            output_file = "premake5.lin.lua"
-        elif current_platform == 'Windows' or current_platform.startswith('MINGW') or current_platform.startswith('MSYS'):
-            output_file = "premake5.win.lua"
         else:
-            elog(f"Warning: Unknown platform '{current_platform}', defaulting to premake5.mac.lua")
-            output_file = "premake5.mac.lua"
+            current_platform = platform.system()
+            platform_key = _host_platform_key(current_platform)
+            if platform_key is None:
+                elog(f"Warning: Unknown platform '{current_platform}', defaulting to premake5.mac.lua")
+                platform_key = 'mac'
+        output_file = _PREMAKE_FILES[platform_key]
 
     vlog(f"DEBUG: Final config_file={config_file}, output_file={output_file}, variant={variant}")
 
     # Generate Premake5 configuration
-    generator = PremakeGenerator(config_file, explicit_platform, variant)
-    generator.parse_config()
+    generator = _create_generator(config_file, explicit_platform, variant)
 
     if not generator.validate_config():
         sys.exit(1)
 
-    generator.generate_premake_file(output_file)
-    vlog(f"Premake5 migration completed successfully!")
-    vlog(f"Generated platform-specific file: {output_file}")
-    vlog(f"Next steps:")
-    vlog(f"  1. Run: premake5 gmake2 --file={output_file}")
-    vlog(f"  2. Run: make -C build/premake config=debug_native")
-    vlog(f"")
-    vlog(f"To generate for other platforms, use:")
-    vlog(f"  python3 utils/generate_premake.py --platform mac")
-    vlog(f"  python3 utils/generate_premake.py --platform linux")
-    vlog(f"  python3 utils/generate_premake.py --platform windows")
+    generator.generate_premake_file(output_file, force=force)
+    if _VERBOSE:
+        vlog("Premake5 migration completed successfully!")
+        vlog(f"Generated platform-specific file: {output_file}")
+        vlog("Next steps:")
+        vlog(f"  1. Run: premake5 gmake2 --file={output_file}")
+        vlog("  2. Run: make -C build/premake config=debug_native")
+        vlog("")
+        vlog("To generate for other platforms, use:")
+        vlog("  python3 utils/generate_premake.py --platform mac")
+        vlog("  python3 utils/generate_premake.py --platform linux")
+        vlog("  python3 utils/generate_premake.py --platform windows")
+        vlog("  python3 utils/generate_premake.py --all   # all three in one run")
 
 if __name__ == "__main__":
     main()